@@ -1,7 +1,38 @@
+import atexit
+import json
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 from utils.logger import AgentLogger
-from utils.file_manager import FileManager
+from utils.file_manager import FileManager, MEMORY_JOURNAL_SECTIONS
+
+
+# Decision records are buffered and written in batches once either limit is reached
+DECISION_BUFFER_MAX_RECORDS = 128
+DECISION_BUFFER_MAX_BYTES = 64 * 1024
+
+# Number of recent journal records (decisions, patterns) kept in agent memory
+MAX_RECENT_DECISIONS = 100
+
+# Minimum interval between background memory writes; saves requested in between are coalesced
+MEMORY_SAVE_DEBOUNCE_SECONDS = 2.0
+
+# Agents with background memory writers, drained at interpreter exit
+_LIVE_AGENTS: "weakref.WeakSet[BaseAgent]" = weakref.WeakSet()
+
+
+@atexit.register
+def _drain_pending_memory_saves():
+    """Write out buffered decisions and any debounced memory saves before the process exits"""
+    for agent in list(_LIVE_AGENTS):
+        agent.flush()
+        agent.flush_memory()
 
 
 class BaseAgent(ABC):
@@ -15,14 +46,39 @@ class BaseAgent(ABC):
         self.config = config
         self.logger = AgentLogger(agent_name)
         self.file_manager = FileManager()
+        
+        # Guards memory and the decision buffer when tasks run on worker threads
+        self._lock = threading.RLock()
         self.memory = self.load_memory()
         
+        # Pending decision log records (serialized JSON lines)
+        self._decision_buffer: List[str] = []
+        self._buffer_bytes = 0
+        
+        # Status snapshot rebuilt only after memory changes
+        self._cached_status: Optional[Mapping[str, Any]] = None
+        self._status_dirty = True
+        
+        # Single background writer for debounced memory saves and other file writes
+        self._memory_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{agent_name}-memory")
+        self._memory_save_pending = False
+        self._last_memory_save = 0.0
+        self._memory_flush_now = threading.Event()
+        _LIVE_AGENTS.add(self)
+        
         self.logger.log_info(f"Initialized {agent_name} agent", {"config_keys": list(config.keys())})
     
     def load_memory(self) -> Dict[str, Any]:
         """Load agent-specific memory from file system"""
         try:
             memory = self.file_manager.load_memory(self.agent_name)
+            
+            # Journal sections are rebuilt from the tail of their JSONL files; older
+            # snapshots that still embed them are used only when no journal exists yet
+            for section in MEMORY_JOURNAL_SECTIONS:
+                records = self.file_manager.tail_jsonl(self.agent_name, section, MAX_RECENT_DECISIONS)
+                memory[section] = deque(records or memory.get(section, []), maxlen=MAX_RECENT_DECISIONS)
+            
             self.logger.log_info("Memory loaded successfully", {"memory_keys": list(memory.keys())})
             return memory
         except Exception as e:
@@ -33,66 +89,152 @@ class BaseAgent(ABC):
         """Save updated memory to file system"""
         try:
             data_to_save = memory_data if memory_data is not None else self.memory
-            self.file_manager.update_memory(self.agent_name, data_to_save)
+            with self._lock:
+                self.file_manager.update_memory(self.agent_name, data_to_save)
+                self._status_dirty = True
             self.logger.log_info("Memory saved successfully")
         except Exception as e:
             self.logger.log_error("memory_save_failed", str(e))
     
-    def log_decision(self, decision_type: str, context: Dict[str, Any], outcome: str):
-        """Log agent decisions for audit and learning"""
-        self.logger.log_decision(decision_type, context, outcome)
+    def save_memory_async(self):
+        """Schedule a background memory save, coalescing requests made within the debounce window"""
+        with self._lock:
+            # A queued save serializes memory when it runs, so it covers this request too
+            if self._memory_save_pending:
+                return
+            self._memory_save_pending = True
         
-        # Update memory with decision patterns
-        if "decisions" not in self.memory:
-            self.memory["decisions"] = []
+        try:
+            self._memory_executor.submit(self._deferred_save_memory)
+        except RuntimeError:
+            # Executor already shut down during interpreter exit
+            with self._lock:
+                self._memory_save_pending = False
+            self.save_memory()
+    
+    def _deferred_save_memory(self):
+        """Wait out the debounce window (unless a flush is requested), then save"""
+        delay = MEMORY_SAVE_DEBOUNCE_SECONDS - (time.monotonic() - self._last_memory_save)
+        if delay > 0:
+            self._memory_flush_now.wait(delay)
         
-        self.memory["decisions"].append({
+        with self._lock:
+            self._memory_save_pending = False
+        self.save_memory()
+        self._last_memory_save = time.monotonic()
+    
+    def _submit_io(self, operation_name: str, func, *args):
+        """Run a file write on the background writer so the caller doesn't wait on disk"""
+        def run():
+            try:
+                func(*args)
+            except Exception as e:
+                self.logger.log_error(f"{operation_name}_failed", str(e))
+        
+        try:
+            self._memory_executor.submit(run)
+        except RuntimeError:
+            # Executor already shut down during interpreter exit
+            run()
+    
+    def flush_memory(self):
+        """Write any pending background memory save now; later saves are written synchronously"""
+        self._memory_flush_now.set()
+        self._memory_executor.shutdown(wait=True)
+    
+    def log_decision(self, decision_type: str, context: Dict[str, Any], outcome: str):
+        """Log agent decisions for audit and learning"""
+        timestamp = datetime.now().isoformat()
+        decision_record = json.dumps({
+            "timestamp": timestamp,
+            "agent": self.agent_name,
             "decision_type": decision_type,
             "context": context,
-            "outcome": outcome,
-            "timestamp": self.logger.logger.handlers[0].format(
-                self.logger.logger.makeRecord(
-                    self.logger.logger.name, 20, "", 0, "", (), None
-                )
-            ).split(" - ")[0]
+            "outcome": outcome
         })
         
-        # Keep only recent decisions (last 100)
-        if len(self.memory["decisions"]) > 100:
-            self.memory["decisions"] = self.memory["decisions"][-100:]
+        with self._lock:
+            self._decision_buffer.append(decision_record)
+            self._buffer_bytes += len(decision_record)
+            
+            # Update memory with decision patterns (bounded deque drops the oldest)
+            self.memory["decisions"].append({
+                "decision_type": decision_type,
+                "context": context,
+                "outcome": outcome,
+                "timestamp": timestamp
+            })
+            self._status_dirty = True
+            
+            if (len(self._decision_buffer) >= DECISION_BUFFER_MAX_RECORDS or
+                    self._buffer_bytes > DECISION_BUFFER_MAX_BYTES):
+                self.flush()
+    
+    def flush(self):
+        """Write buffered decision records to the decision log in a single batch"""
+        with self._lock:
+            if not self._decision_buffer:
+                return
+            
+            batch = self._decision_buffer
+            self._decision_buffer = []
+            self._buffer_bytes = 0
+            
+            try:
+                self.file_manager.append_jsonl(self.agent_name, "decisions", batch)
+            except Exception as e:
+                self.logger.log_error("decision_flush_failed", str(e), {"records": len(batch)})
+            
+            # The same records go to the agent log and console, one logging call per batch
+            self.logger.log_decisions(batch)
+    
+    def _get_metrics(self) -> Dict[str, Any]:
+        """Return the performance metrics dict in memory, creating it if needed"""
+        return self.memory.setdefault("performance_metrics", {})
     
     def update_performance_metrics(self, metric_name: str, metric_value: Any):
         """Update performance metrics in memory"""
-        if "performance_metrics" not in self.memory:
-            self.memory["performance_metrics"] = {}
-        
-        self.memory["performance_metrics"][metric_name] = metric_value
+        with self._lock:
+            self._get_metrics()[metric_name] = metric_value
+            self._status_dirty = True
+        self.logger.log_info(f"Updated metric: {metric_name}", {"value": metric_value})
+    
+    def increment_performance_metric(self, metric_name: str, amount: Any = 1):
+        """Atomically add to a counter metric in memory"""
+        with self._lock:
+            metrics = self._get_metrics()
+            metric_value = metrics[metric_name] = metrics.get(metric_name, 0) + amount
+            self._status_dirty = True
         self.logger.log_info(f"Updated metric: {metric_name}", {"value": metric_value})
     
     def learn_from_success(self, pattern: Dict[str, Any]):
         """Record successful patterns for future learning"""
-        if "successful_patterns" not in self.memory:
-            self.memory["successful_patterns"] = []
-        
-        self.memory["successful_patterns"].append(pattern)
+        self._record_pattern("successful_patterns", pattern)
         self.logger.log_info("Recorded successful pattern", pattern)
     
     def learn_from_failure(self, pattern: Dict[str, Any]):
         """Record failed patterns to avoid in future"""
-        if "failed_patterns" not in self.memory:
-            self.memory["failed_patterns"] = []
-        
-        self.memory["failed_patterns"].append(pattern)
+        self._record_pattern("failed_patterns", pattern)
         self.logger.log_info("Recorded failed pattern", pattern)
     
+    def _record_pattern(self, section: str, pattern: Dict[str, Any]):
+        """Append a learned pattern to its journal and the in-memory window"""
+        with self._lock:
+            self.memory[section].append(pattern)
+            self._status_dirty = True
+            try:
+                self.file_manager.append_jsonl(self.agent_name, section, [json.dumps(pattern, default=str)])
+            except Exception as e:
+                self.logger.log_error("pattern_append_failed", str(e), {"section": section})
+    
     def _get_default_memory(self) -> Dict[str, Any]:
         """Get default memory structure for the agent"""
         return {
             "learnings": {},
-            "successful_patterns": [],
-            "failed_patterns": [],
+            "successful_patterns": deque(maxlen=MAX_RECENT_DECISIONS),
+            "failed_patterns": deque(maxlen=MAX_RECENT_DECISIONS),
             "performance_metrics": {},
-            "decisions": [],
+            "decisions": deque(maxlen=MAX_RECENT_DECISIONS),
             "last_updated": None
         }
     
@@ -112,13 +254,17 @@ class BaseAgent(ABC):
         """
         pass
     
-    def get_agent_status(self) -> Dict[str, Any]:
+    def get_agent_status(self) -> Mapping[str, Any]:
         """Get current agent status and health information"""
-        return {
-            "agent_name": self.agent_name,
-            "memory_loaded": bool(self.memory),
-            "config_loaded": bool(self.config),
-            "recent_decisions": len(self.memory.get("decisions", [])),
-            "performance_metrics": self.memory.get("performance_metrics", {}),
-            "last_memory_update": self.memory.get("last_updated")
-        }
\ No newline at end of file
+        with self._lock:
+            if self._status_dirty or self._cached_status is None:
+                self._cached_status = MappingProxyType({
+                    "agent_name": self.agent_name,
+                    "memory_loaded": bool(self.memory),
+                    "config_loaded": bool(self.config),
+                    "recent_decisions": len(self.memory.get("decisions", [])),
+                    "performance_metrics": MappingProxyType(dict(self.memory.get("performance_metrics", {}))),
+                    "last_memory_update": self.memory.get("last_updated")
+                })
+                self._status_dirty = False
+            return self._cached_status
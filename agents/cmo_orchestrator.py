@@ -1,9 +1,133 @@
-import json
-from typing import List, Dict, Any
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from operator import itemgetter
+from queue import Queue
+from typing import List, Dict, Any, Callable, Optional, Set
+from weakref import WeakValueDictionary
 from agents.base_agent import BaseAgent
-from config.prompts.cmo_prompts import CMO_SYSTEM_PROMPT, INSIGHT_EXTRACTION_PROMPT, INSIGHT_PRIORITIZATION_PROMPT
+from config.prompts.cmo_prompts import (
+    CMO_SYSTEM_PROMPT,
+    INSIGHT_EXTRACTION_TEMPLATE,
+    EXTRACT_AND_PRIORITIZE_TEMPLATE,
+    INSIGHT_PRIORITIZATION_TEMPLATE
+)
+from utils import json_utils
 from utils.api_client import OpenRouterClient, ModelRouter, ContentGenerationError
 
+# Output budgets for the extraction calls
+INSIGHT_EXTRACTION_MAX_TOKENS = 2000
+EXTRACT_PRIORITIZE_MAX_TOKENS = 3000
+
+_REQUIRED_INSIGHT_FIELDS = frozenset(("title", "type", "content"))
+_REQUIRED_TASK_FIELDS = frozenset(("transcript_path",))
+_REQUIRED_PROCESSING_TASK_FIELDS = frozenset(("type", "transcript_path"))
+_VALID_INSIGHT_TYPES = frozenset(("framework", "contrarian_take", "case_study", "tactical_tip"))
+_RESEARCH_ANGLE_BY_TYPE = {
+    "contrarian_take": "supporting_evidence",
+    "framework": "implementation_examples",
+    "case_study": "similar_cases"
+}
+_PRIORITY_BOOST_BY_TYPE = {"framework": 0.2}
+
+# Terms that mark transcript passages likely to contain business insights
+_INSIGHT_KEYWORDS = frozenset((
+    "business", "customer", "customers", "revenue", "profit", "margin", "pricing", "price",
+    "sales", "marketing", "growth", "hire", "hiring", "team", "cash", "framework", "process",
+    "strategy", "sme", "owner", "owners", "clients", "cost", "costs", "mistake", "lesson",
+    "system", "systems", "data", "results", "scale"
+))
+
+
+def _digest(text: str) -> str:
+    """Short stable hash used for response cache keys"""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Fingerprint of each transcript-driven prompt; editing a template or its budget
+# changes the fingerprint and so invalidates the responses cached under it
+_TRANSCRIPT_PROMPT_HASHES = {
+    task_type: _digest("\x1f".join((CMO_SYSTEM_PROMPT, str(template), str(max_tokens))))
+    for task_type, template, max_tokens in (
+        ("insight_extraction", INSIGHT_EXTRACTION_TEMPLATE, INSIGHT_EXTRACTION_MAX_TOKENS),
+        ("extract_prioritize", EXTRACT_AND_PRIORITIZE_TEMPLATE, EXTRACT_PRIORITIZE_MAX_TOKENS)
+    )
+}
+
+
+def _extract_json_array(text: str) -> Optional[List[Any]]:
+    """Find the first balanced JSON array embedded in text, tracking bracket depth outside strings"""
+    start = text.find('[')
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped = False
+        for pos in range(start, len(text)):
+            char = text[pos]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == '\\':
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char in '[{':
+                depth += 1
+            elif char in ']}':
+                depth -= 1
+                if depth == 0:
+                    try:
+                        candidate = json_utils.loads(text[start:pos + 1])
+                    except json_utils.JSONDecodeError:
+                        break
+                    if isinstance(candidate, list):
+                        return candidate
+                    break
+        start = text.find('[', start + 1)
+    return None
+
+
+class AgentNotRegistered(ValueError):
+    """Exception raised when a specialist agent is used before it has been registered"""
+    pass
+
+
+class _AgentSlot:
+    """
+    Descriptor that resolves a specialist agent from the orchestrator's weak registry.
+    Callers must keep their own strong reference to each assigned agent; one that has
+    been garbage collected raises AgentNotRegistered on the next read.
+    """
+    
+    def __set_name__(self, owner, name: str):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        
+        agent = instance._registry.get(self.name)
+        if agent is None:
+            if self.name in instance._assigned_slots:
+                instance.logger.log_error("agent_reference_dead", 
+                                         "Registered agent was garbage collected; keep a strong reference to it",
+                                         {"slot": self.name})
+                raise AgentNotRegistered(f"Specialist agent was garbage collected: {self.name}")
+            raise AgentNotRegistered(f"Specialist agent not registered: {self.name}")
+        return agent
+    
+    def __set__(self, instance, agent: Optional[BaseAgent]):
+        if agent is None:
+            instance._registry.pop(self.name, None)
+            instance._assigned_slots.discard(self.name)
+        else:
+            instance._registry[self.name] = agent
+            instance._assigned_slots.add(self.name)
+
 
 class CMOOrchestrator(BaseAgent):
     """
@@ -11,6 +135,19 @@ class CMOOrchestrator(BaseAgent):
     content creation across all specialist agents.
     """
     
+    # Constant fields shared by every sub-agent task; per-insight fields are merged in
+    _RESEARCH_TASK_TEMPLATE = {
+        "type": "research_insight",
+        "max_sources": 3,
+        "focus_areas": ("sme_examples", "supporting_data", "case_studies")
+    }
+    _CONTENT_TASK_TEMPLATE = {"type": "generate_content"}
+    _PUBLISHING_TASK_TEMPLATE = {"type": "schedule_content"}
+    
+    research_agent = _AgentSlot()
+    content_agent = _AgentSlot()
+    publishing_agent = _AgentSlot()
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__("cmo_orchestrator", config)
         # Initialize OpenRouter client and model router
@@ -21,10 +158,11 @@ class CMOOrchestrator(BaseAgent):
         self.openrouter_client = OpenRouterClient(openrouter_key, config)
         self.model_router = ModelRouter(self.openrouter_client)
         
-        # Will be injected during initialization
-        self.research_agent = None
-        self.content_agent = None  
-        self.publishing_agent = None
+        # Specialist agents are registered during initialization; the orchestrator
+        # only holds weak references so it never pins agents on its own
+        self._registry: "WeakValueDictionary[str, BaseAgent]" = WeakValueDictionary()
+        # Slots that were assigned, so a dead weak reference isn't mistaken for "never registered"
+        self._assigned_slots: Set[str] = set()
         
         # Configuration with cost limits
         self.max_insights_per_episode = min(
@@ -32,6 +170,26 @@ class CMOOrchestrator(BaseAgent):
             config.get("cost_limits", {}).get("max_insights_per_episode", 5)
         )
         self.min_priority_score = 0.6  # Minimum score for content creation
+        self.max_transcript_tokens = config.get("cost_limits", {}).get("max_transcript_tokens", 12000)
+        self.pipeline_workers = max(1, config.get("content", {}).get("pipeline_workers", 4))
+        
+        # Episode being processed, attached to API calls for cost tracking
+        self._current_episode_id: Optional[str] = None
+        
+        # LLM responses keyed by prompt hash: in-process LRU in front of a disk cache
+        cache_config = config.get("cache", {})
+        self.llm_cache_enabled = cache_config.get("enable_llm_cache", True)
+        self._llm_cache_size = cache_config.get("llm_memory_entries", 128)
+        self._llm_cache: "OrderedDict[str, str]" = OrderedDict()
+        self.llm_cache_ttl_seconds = cache_config.get("llm_cache_ttl_days", 30) * 86400
+        
+        # Config sections passed to every sub-agent task
+        self._content_mix = config.get("content", {}).get("content_mix", {})
+        self._publishing_config = config.get("publishing", {})
+        
+        # Brand voice is reloaded only when the file changes on disk
+        self._brand_voice_cache = None
+        self._brand_voice_mtime = 0
     
     def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process a general task - delegates to process_transcript for transcript tasks"""
@@ -47,8 +205,8 @@ class CMOOrchestrator(BaseAgent):
     
     def validate_input(self, task: Dict[str, Any]) -> bool:
         """Validate task input"""
-        required_fields = ["type", "transcript_path"] if task.get("type") == "transcript_processing" else ["transcript_path"]
-        return all(field in task for field in required_fields)
+        required_fields = _REQUIRED_PROCESSING_TASK_FIELDS if task.get("type") == "transcript_processing" else _REQUIRED_TASK_FIELDS
+        return required_fields.issubset(task)
     
     def process_transcript(self, transcript_path: str) -> Dict[str, Any]:
         """
@@ -66,17 +224,17 @@ class CMOOrchestrator(BaseAgent):
                             {"episode_id": episode_id, "word_count": transcript_data["word_count"]}, 
                             "success")
             
-            # Extract business insights
-            insights = self.extract_business_insights(transcript_data["content"])
-            
-            # Prioritize insights for content creation
-            prioritized_insights = self.prioritize_insights(insights)
+            # Extract and prioritize business insights in a single model call
+            prioritized_insights = self.extract_and_prioritize_insights(transcript_data["content"])
+            insights = prioritized_insights
             
-            # Filter by minimum priority score and limit count
-            qualified_insights = [
-                insight for insight in prioritized_insights 
-                if insight.get("priority_score", 0) >= self.min_priority_score
-            ][:self.max_insights_per_episode]
+            # Filter by minimum priority score and limit count in one lazy pass;
+            # the list is already ranked, so stop once enough insights qualify
+            qualified_insights = list(islice(
+                (insight for insight in prioritized_insights
+                 if insight.get("priority_score", 0) >= self.min_priority_score),
+                self.max_insights_per_episode
+            ))
             
             self.log_decision("insights_filtered", 
                             {"total_extracted": len(insights), 
@@ -89,11 +247,16 @@ class CMOOrchestrator(BaseAgent):
             # Save processing results
             processing_summary = {
                 "episode_id": episode_id,
-                "transcript_data": transcript_data,
+                # Reference the transcript on disk rather than duplicating its text
+                "transcript_ref": {
+                    "path": transcript_data["file_path"],
+                    "word_count": transcript_data["word_count"],
+                    "sha1": hashlib.sha1(transcript_data["content"].encode("utf-8")).hexdigest()
+                },
                 "insights_extracted": len(insights),
                 "insights_processed": len(qualified_insights),
                 "content_pipeline_results": results,
-                "processing_completed_at": self.file_manager.load_memory("cmo_orchestrator").get("last_updated")
+                "processing_completed_at": self.memory.get("last_updated")
             }
             
             self.file_manager.save_generated_content(episode_id, processing_summary)
@@ -103,8 +266,7 @@ class CMOOrchestrator(BaseAgent):
                             "completed")
             
             # Update performance metrics
-            self.update_performance_metrics("episodes_processed", 
-                                          self.memory.get("performance_metrics", {}).get("episodes_processed", 0) + 1)
+            self.increment_performance_metric("episodes_processed")
             self.update_performance_metrics("avg_insights_per_episode", 
                                           len(qualified_insights))
             
@@ -118,70 +280,71 @@ class CMOOrchestrator(BaseAgent):
                             {"file": transcript_path, "error": str(e)}, 
                             "failed")
             raise
+        
+        finally:
+            # Write out buffered decision logs for all agents touched by this episode
+            for agent in (self, *self._registry.values()):
+                agent.flush()
+    
+    def process_transcripts_batch(self, transcript_paths: List[str]) -> List[Dict[str, Any]]:
+        """Process several transcripts, running their extraction calls concurrently up front"""
+        if not transcript_paths:
+            return []
+        
+        # Warm the response cache for every transcript at once; each episode then
+        # runs through the normal path and its extraction call is a cache hit
+        if self.llm_cache_enabled:
+            workers = min(len(transcript_paths), self.pipeline_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._prewarm_extraction, transcript_paths))
+        
+        batch_results = []
+        for transcript_path in transcript_paths:
+            try:
+                batch_results.append(self.process_transcript(transcript_path))
+            except Exception as e:
+                batch_results.append({
+                    "transcript_path": transcript_path,
+                    "error": str(e),
+                    "status": "failed"
+                })
+        
+        return batch_results
+    
+    def _prewarm_extraction(self, transcript_path: str):
+        """Run the combined extraction call for a transcript so its response is cached"""
+        try:
+            transcript_data = self.file_manager.load_transcript(transcript_path)
+            episode_id = self.file_manager.get_episode_id_from_transcript(transcript_path)
+            
+            transcript = self._truncate_for_model(transcript_data["content"])
+            self._cached_generate(
+                task_type="extract_prioritize",
+                system_prompt=CMO_SYSTEM_PROMPT,
+                user_prompt=EXTRACT_AND_PRIORITIZE_TEMPLATE.render(transcript=transcript),
+                max_tokens=EXTRACT_PRIORITIZE_MAX_TOKENS,
+                parse=self._parse_prioritized_insights,
+                episode_id=episode_id,
+                cache_content=transcript
+            )
+        except Exception as e:
+            # The episode's own run will retry and report the failure
+            self.logger.log_error("extraction_prewarm_failed", str(e), {"transcript_path": transcript_path})
     
     def extract_business_insights(self, transcript: str) -> List[Dict[str, Any]]:
         """Use Claude to extract key business frameworks and insights"""
         try:
-            prompt = INSIGHT_EXTRACTION_PROMPT.format(transcript=transcript)
+            trimmed = self._truncate_for_model(transcript)
             
-            response = self.model_router.generate_content(
+            validated_insights = self._cached_generate(
                 task_type="insight_extraction",
                 system_prompt=CMO_SYSTEM_PROMPT,
-                user_prompt=prompt,
-                max_tokens=2000,
-                agent_name="cmo_orchestrator",
-                episode_id=getattr(self, '_current_episode_id', None)
+                user_prompt=INSIGHT_EXTRACTION_TEMPLATE.render(transcript=trimmed),
+                max_tokens=INSIGHT_EXTRACTION_MAX_TOKENS,
+                parse=lambda response: self._validate_insights(self._parse_llm_json(response)),
+                cache_content=trimmed
             )
             
-            # Parse structured response from Claude
-            # First, clean the response by removing markdown code blocks if present
-            cleaned_response = response.strip()
-            if cleaned_response.startswith('```json'):
-                cleaned_response = cleaned_response.replace('```json', '').replace('```', '').strip()
-            elif cleaned_response.startswith('```'):
-                cleaned_response = cleaned_response.replace('```', '').strip()
-            
-            try:
-                parsed_response = json.loads(cleaned_response)
-                
-                # Handle different response formats from Claude
-                if isinstance(parsed_response, list):
-                    insights = parsed_response
-                elif isinstance(parsed_response, dict) and 'insights' in parsed_response:
-                    insights = parsed_response['insights']
-                else:
-                    self.logger.log_error("unexpected_response_format", 
-                                        f"Unexpected response format: {type(parsed_response).__name__}", 
-                                        {"response_content": str(parsed_response)[:500]})
-                    raise ValueError("Response format not recognized - expected list or dict with 'insights' key")
-                
-                if not isinstance(insights, list):
-                    raise ValueError("Insights is not a list")
-                    
-            except json.JSONDecodeError as e:
-                self.logger.log_error("json_parse_error", f"Failed to parse Claude response: {e}", {"response": cleaned_response[:500]})
-                # Try to extract JSON from response if it's wrapped in other text
-                import re
-                json_match = re.search(r'\[.*\]', cleaned_response, re.DOTALL)
-                if json_match:
-                    try:
-                        insights = json.loads(json_match.group())
-                    except json.JSONDecodeError:
-                        raise ContentGenerationError("Could not extract valid JSON from Claude response")
-                else:
-                    raise ContentGenerationError("Could not extract valid JSON from Claude response")
-            
-            # Validate insight structure
-            validated_insights = []
-            for i, insight in enumerate(insights):
-                if self._validate_insight_structure(insight):
-                    insight["id"] = f"insight_{i+1}_{insight.get('id', str(i+1))}"
-                    validated_insights.append(insight)
-                else:
-                    self.logger.log_error("invalid_insight_structure", 
-                                        f"Skipping insight {i} due to invalid structure", 
-                                        {"insight": insight})
-            
             self.log_decision("insight_extraction", 
                             {"transcript_length": len(transcript), "insights_found": len(validated_insights)}, 
                             f"extracted {len(validated_insights)} valid insights")
@@ -194,50 +357,153 @@ class CMOOrchestrator(BaseAgent):
             self.logger.log_error("insight_extraction_error", str(e))
             raise ContentGenerationError(f"Failed to extract insights: {e}")
     
+    def extract_and_prioritize_insights(self, transcript: str) -> List[Dict[str, Any]]:
+        """Extract insights with priority scores in one call, falling back to extract then prioritize"""
+        try:
+            trimmed = self._truncate_for_model(transcript)
+            
+            insights = self._cached_generate(
+                task_type="extract_prioritize",
+                system_prompt=CMO_SYSTEM_PROMPT,
+                user_prompt=EXTRACT_AND_PRIORITIZE_TEMPLATE.render(transcript=trimmed),
+                max_tokens=EXTRACT_PRIORITIZE_MAX_TOKENS,
+                parse=self._parse_prioritized_insights,
+                cache_content=trimmed
+            )
+            insights.sort(key=lambda x: x["priority_score"], reverse=True)
+            
+            self.log_decision("insight_extraction", 
+                            {"transcript_length": len(transcript), "insights_found": len(insights)}, 
+                            f"extracted and prioritized {len(insights)} valid insights")
+            
+            return insights
+            
+        except Exception as e:
+            self.logger.log_error("extract_prioritize_error", 
+                                f"Combined extraction failed, using two-step path: {e}")
+            return self.prioritize_insights(self.extract_business_insights(transcript))
+    
+    def _parse_prioritized_insights(self, response: str) -> List[Dict[str, Any]]:
+        """Parse a combined extract-and-prioritize response; every insight must carry a score"""
+        insights = self._validate_insights(self._parse_llm_json(response))
+        if not all(isinstance(insight.get("priority_score"), (int, float)) for insight in insights):
+            raise ValueError("Combined response is missing priority scores")
+        return insights
+    
+    def _truncate_for_model(self, transcript: str) -> str:
+        """Trim a transcript to the token budget, keeping the passages most likely to hold insights"""
+        chars_per_token = self.openrouter_client.chars_per_token
+        budget_chars = self.max_transcript_tokens * chars_per_token
+        if len(transcript) <= budget_chars:
+            return transcript
+        
+        # Rank paragraphs (or lines, for transcripts without blank-line breaks)
+        # by keyword density and keep the best ones in their original order
+        segments = [p for p in transcript.split("\n\n") if p.strip()]
+        if len(segments) == 1:
+            segments = [line for line in transcript.splitlines() if line.strip()]
+        
+        def keyword_density(index: int) -> float:
+            words = segments[index].lower().split()
+            hits = sum(1 for word in words if word.strip(".,!?;:\"'()") in _INSIGHT_KEYWORDS)
+            return hits / (len(words) or 1)
+        
+        kept = []
+        used_chars = 0
+        for index in sorted(range(len(segments)), key=keyword_density, reverse=True):
+            segment_chars = len(segments[index]) + 2
+            if used_chars + segment_chars > budget_chars:
+                continue
+            kept.append(index)
+            used_chars += segment_chars
+        
+        if not kept:
+            # A single oversized segment: fall back to a hard cut
+            truncated = transcript[:budget_chars]
+        else:
+            truncated = "\n\n".join(segments[index] for index in sorted(kept))
+        
+        self.log_decision("transcript_truncated", 
+                        {"original_tokens": len(transcript) // chars_per_token,
+                         "kept_tokens": len(truncated) // chars_per_token}, 
+                        "trimmed_to_token_budget")
+        
+        return truncated
+    
+    def _parse_llm_json(self, response: str) -> List[Any]:
+        """Parse the array a model returned, as a bare list or wrapped in a dict, possibly inside prose"""
+        cleaned_response = json_utils.strip_code_fences(response)
+        
+        try:
+            parsed_response = json_utils.loads(cleaned_response)
+        except json_utils.JSONDecodeError as e:
+            self.logger.log_error("json_parse_error", f"Failed to parse Claude response: {e}", {"response": cleaned_response[:500]})
+            # Try to extract JSON from response if it's wrapped in other text
+            items = _extract_json_array(cleaned_response)
+            if items is None:
+                raise ContentGenerationError("Could not extract valid JSON from Claude response")
+            return items
+        
+        # Handle different response formats from Claude
+        if isinstance(parsed_response, list):
+            return parsed_response
+        if isinstance(parsed_response, dict):
+            if isinstance(parsed_response.get('insights'), list):
+                return parsed_response['insights']
+            for value in parsed_response.values():
+                if isinstance(value, list):
+                    return value
+        
+        self.logger.log_error("unexpected_response_format", 
+                            f"Unexpected response format: {type(parsed_response).__name__}", 
+                            {"response_content": str(parsed_response)[:500]})
+        raise ValueError("Response format not recognized - expected list or dict containing a list")
+    
+    def _validate_insights(self, insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep structurally valid insights and assign their ids"""
+        validated_insights = [
+            dict(insight, id=f"insight_{n}_{insight['id']}" if insight.get("id") else f"insight_{n}")
+            for n, insight in enumerate(insights, 1)
+            if self._validate_insight_structure(insight)
+        ]
+        
+        if len(validated_insights) < len(insights):
+            for i, insight in enumerate(insights):
+                if not self._validate_insight_structure(insight):
+                    self.logger.log_error("invalid_insight_structure", 
+                                        f"Skipping insight {i} due to invalid structure", 
+                                        {"insight": insight})
+        
+        return validated_insights
+    
     def prioritize_insights(self, insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Rank insights by content potential and brand alignment"""
         if not insights:
             return []
         
+        # Ranking one or two insights isn't worth an API call: keep the scores from
+        # extraction when every insight has one, otherwise score them locally
+        if len(insights) <= 2:
+            if all(isinstance(insight.get("priority_score"), (int, float)) for insight in insights):
+                return sorted(insights, key=lambda x: x["priority_score"], reverse=True)
+            return self._fallback_prioritization(insights)
+        
         try:
             # Use Claude to prioritize insights
-            prompt = INSIGHT_PRIORITIZATION_PROMPT.format(insights=json.dumps(insights, indent=2))
-            
-            response = self.model_router.generate_content(
-                task_type="insight_prioritization",
-                system_prompt=CMO_SYSTEM_PROMPT,
-                user_prompt=prompt,
-                max_tokens=2000,
-                agent_name="cmo_orchestrator",
-                episode_id=getattr(self, '_current_episode_id', None)
+            prompt = INSIGHT_PRIORITIZATION_TEMPLATE.render(
+                insights=json_utils.dumps(insights)
             )
             
-            # Parse prioritized insights
+            # Parse prioritized insights, falling back to manual prioritization if invalid
             try:
-                # Clean the response by removing markdown code blocks if present
-                cleaned_response = response.strip()
-                if cleaned_response.startswith('```json'):
-                    cleaned_response = cleaned_response.replace('```json', '').replace('```', '').strip()
-                elif cleaned_response.startswith('```'):
-                    cleaned_response = cleaned_response.replace('```', '').strip()
-                
-                parsed_response = json.loads(cleaned_response)
-                
-                # Handle different response formats from Claude
-                if isinstance(parsed_response, list):
-                    prioritized_insights = parsed_response
-                elif isinstance(parsed_response, dict) and 'insights' in parsed_response:
-                    prioritized_insights = parsed_response['insights']
-                else:
-                    # Try to get any array from the response
-                    for value in parsed_response.values():
-                        if isinstance(value, list):
-                            prioritized_insights = value
-                            break
-                    else:
-                        raise ValueError("No valid insights array found in response")
-            except json.JSONDecodeError:
-                # Fallback to manual prioritization if Claude response is invalid
+                prioritized_insights = self._cached_generate(
+                    task_type="insight_prioritization",
+                    system_prompt=CMO_SYSTEM_PROMPT,
+                    user_prompt=prompt,
+                    max_tokens=2000,
+                    parse=self._parse_llm_json
+                )
+            except ContentGenerationError:
                 self.logger.log_error("prioritization_parse_error", 
                                     "Failed to parse prioritization response, using fallback")
                 prioritized_insights = self._fallback_prioritization(insights)
@@ -253,135 +519,274 @@ class CMOOrchestrator(BaseAgent):
             # Use fallback prioritization
             return self._fallback_prioritization(insights)
     
+    def _cached_generate(self, task_type: str, system_prompt: str, user_prompt: str, max_tokens: int,
+                         parse: Callable[[str], Any], should_cache: Callable[[Any], bool] = bool,
+                         episode_id: Optional[str] = None, cache_content: Optional[str] = None) -> Any:
+        """
+        Generate via the model router and return parse(response), reusing earlier responses to
+        identical prompts. Only responses that parse (and pass should_cache) are cached, so a
+        malformed reply is never replayed; a cached reply that no longer parses is discarded.
+        Transcript-driven calls pass cache_content so they are keyed by prompt version and
+        transcript hash instead of hashing the whole rendered prompt.
+        """
+        if episode_id is None:
+            episode_id = self._current_episode_id
+        
+        if not self.llm_cache_enabled:
+            return parse(self.model_router.generate_content(
+                task_type=task_type,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                max_tokens=max_tokens,
+                agent_name="cmo_orchestrator",
+                episode_id=episode_id
+            ))
+        
+        # Whitespace is collapsed so trivially reformatted transcripts still hit. The routed
+        # model is part of every key, so re-routing a task doesn't serve the old model's answers
+        model = self.model_router.model_for(task_type)
+        prompt_hash = _TRANSCRIPT_PROMPT_HASHES.get(task_type)
+        if cache_content is not None and prompt_hash is not None:
+            namespace = "insights"
+            key = f"{prompt_hash}-{_digest(model)}-{_digest(' '.join(cache_content.split()))}"
+        else:
+            namespace = "llm"
+            normalized_prompt = " ".join(user_prompt.split())
+            key = _digest("\x1f".join((task_type, model, system_prompt, normalized_prompt, str(max_tokens))))
+        
+        with self._lock:
+            response = self._llm_cache.get(key)
+            if response is not None:
+                self._llm_cache.move_to_end(key)
+        
+        if response is None:
+            response = self.file_manager.load_cached_response(namespace, key,
+                                                              max_age_seconds=self.llm_cache_ttl_seconds)
+            cache_tier = "disk"
+        else:
+            cache_tier = "memory"
+        
+        if response is not None:
+            try:
+                parsed = parse(response)
+            except Exception as e:
+                # Written before responses were validated, or the parser got stricter
+                self.logger.log_error("llm_cache_entry_invalid", str(e), {"task_type": task_type})
+                self._discard_cached_response(namespace, key)
+            else:
+                self.log_decision("llm_cache_hit", {"task_type": task_type, "tier": cache_tier}, "api_call_skipped")
+                self._remember_response(key, response)
+                return parsed
+        
+        response = self.model_router.generate_content(
+            task_type=task_type,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
+            agent_name="cmo_orchestrator",
+            episode_id=episode_id
+        )
+        
+        # Raises for a malformed response, which therefore never reaches the cache
+        parsed = parse(response)
+        if should_cache(parsed):
+            try:
+                self.file_manager.save_cached_response(namespace, key, response)
+            except OSError as e:
+                self.logger.log_error("llm_cache_write_failed", str(e), {"task_type": task_type})
+            self._remember_response(key, response)
+        
+        return parsed
+    
+    def _remember_response(self, key: str, response: str):
+        """Keep a validated response in the in-process LRU"""
+        with self._lock:
+            self._llm_cache[key] = response
+            self._llm_cache.move_to_end(key)
+            if len(self._llm_cache) > self._llm_cache_size:
+                self._llm_cache.popitem(last=False)
+    
+    def _discard_cached_response(self, namespace: str, key: str):
+        """Drop a response from both cache tiers"""
+        with self._lock:
+            self._llm_cache.pop(key, None)
+        self.file_manager.delete_cached_response(namespace, key)
+    
     def coordinate_content_creation(self, episode_id: str, insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Coordinate research, content generation, and publishing for all insights"""
-        if not all([self.research_agent, self.content_agent, self.publishing_agent]):
-            raise ValueError("Specialist agents not properly initialized")
+        # Resolving the specialists up front fails fast on a missing registration
+        # and keeps them alive for the duration of the run
+        specialists = (self.research_agent, self.content_agent, self.publishing_agent)
         
-        content_pipeline_results = []
+        # Results are index-assigned so they keep the input order of the insights
+        content_pipeline_results: List[Optional[Dict[str, Any]]] = [None] * len(insights)
+        if not insights:
+            return content_pipeline_results
         
-        for insight in insights:
-            try:
-                self.log_decision("processing_insight", 
-                                {"insight_id": insight["id"], "title": insight["title"]}, 
-                                "started")
-                
-                # Research phase
-                research_task = self._create_research_task(insight)
-                research_results = self.research_agent.process_task(research_task)
-                
-                # Content generation phase
-                content_task = self._create_content_task(insight, research_results)
-                content_results = self.content_agent.process_task(content_task)
-                
-                # Publishing phase
-                publishing_task = self._create_publishing_task(episode_id, content_results)
-                publishing_results = self.publishing_agent.process_task(publishing_task)
-                
-                pipeline_result = {
-                    "insight": insight,
-                    "research": research_results,
-                    "content": content_results,
-                    "publishing": publishing_results,
-                    "status": "completed"
+        # Brand voice and content mix are the same for every insight in the episode
+        try:
+            content_requirements = self._build_content_requirements()
+        except Exception as e:
+            return [self._failed_pipeline_result(insight, e) for insight in insights]
+        
+        # No point starting more workers than there are insights
+        workers = min(len(insights), self.pipeline_workers)
+        
+        # Research and content generation run concurrently across insights while a
+        # single publisher thread drains finished content, so publishing for one
+        # insight overlaps generation for the next and slot assignment stays serial
+        publish_queue: Queue = Queue(maxsize=workers)
+        publisher = threading.Thread(
+            target=self._publish_worker,
+            args=(episode_id, publish_queue, content_pipeline_results),
+            name="cmo-publisher",
+            daemon=True
+        )
+        publisher.start()
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self._prepare_insight_content, insight, content_requirements): index
+                    for index, insight in enumerate(insights)
                 }
-                
-                content_pipeline_results.append(pipeline_result)
+                for future in as_completed(futures):
+                    publish_queue.put((futures[future], future.result()))
+        finally:
+            publish_queue.put(None)
+            publisher.join()
+        
+        return content_pipeline_results
+    
+    def _prepare_insight_content(self, insight: Dict[str, Any], 
+                                 content_requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the research and content generation stages for a single insight"""
+        try:
+            self.log_decision("processing_insight", 
+                            {"insight_id": insight["id"], "title": insight["title"]}, 
+                            "started")
+            
+            # Research phase
+            research_task = self._create_research_task(insight)
+            research_results = self.research_agent.process_task(research_task)
+            
+            # Content generation phase
+            content_task = self._create_content_task(insight, research_results, content_requirements)
+            content_results = self.content_agent.process_task(content_task)
+            
+            return {
+                "insight": insight,
+                "research": research_results,
+                "content": content_results,
+                "status": "content_ready"
+            }
+            
+        except Exception as e:
+            return self._failed_pipeline_result(insight, e)
+    
+    def _publish_worker(self, episode_id: str, publish_queue: Queue, results: List[Optional[Dict[str, Any]]]):
+        """Consume (index, prepared insight) pairs and run the publishing stage until a None sentinel arrives"""
+        while True:
+            item = publish_queue.get()
+            if item is None:
+                break
+            index, staged = item
+            
+            # Failures from earlier stages pass straight through to the results
+            if staged["status"] == "failed":
+                results[index] = staged
+                continue
+            
+            insight = staged["insight"]
+            try:
+                publishing_task = self._create_publishing_task(episode_id, staged["content"])
+                staged["publishing"] = self.publishing_agent.process_task(publishing_task)
+                staged["status"] = "completed"
+                results[index] = staged
                 
                 self.log_decision("processing_insight", 
                                 {"insight_id": insight["id"]}, 
                                 "completed_successfully")
                 
             except Exception as e:
-                self.logger.log_error("insight_processing_error", 
-                                    str(e), 
-                                    {"insight_id": insight["id"], "title": insight["title"]})
-                
-                # Add failed result to maintain tracking
-                content_pipeline_results.append({
-                    "insight": insight,
-                    "error": str(e),
-                    "status": "failed"
-                })
+                results[index] = self._failed_pipeline_result(insight, e)
+    
+    def _failed_pipeline_result(self, insight: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Log a pipeline failure and build the failed result used for tracking"""
+        self.logger.log_error("insight_processing_error", 
+                            str(error), 
+                            {"insight_id": insight["id"], "title": insight["title"]})
         
-        return content_pipeline_results
+        return {
+            "insight": insight,
+            "error": str(error),
+            "status": "failed"
+        }
     
     def _create_research_task(self, insight: Dict[str, Any]) -> Dict[str, Any]:
         """Create research task for the research agent"""
         return {
-            "type": "research_insight",
+            **self._RESEARCH_TASK_TEMPLATE,
             "insight": insight,
-            "research_angle": self._determine_research_angle(insight),
-            "max_sources": 3,
-            "focus_areas": ["sme_examples", "supporting_data", "case_studies"]
+            "research_angle": self._determine_research_angle(insight)
         }
     
-    def _create_content_task(self, insight: Dict[str, Any], research_results: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_content_task(self, insight: Dict[str, Any], research_results: Dict[str, Any],
+                             content_requirements: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create content generation task for the content agent"""
         return {
-            "type": "generate_content",
+            **self._CONTENT_TASK_TEMPLATE,
             "insight": insight,
             "research_data": research_results,
-            "content_requirements": {
-                "brand_voice": self.file_manager.load_brand_voice(),
-                "max_pieces": 5,
-                "content_mix": self.config.get("content", {}).get("content_mix", {})
-            }
+            "content_requirements": content_requirements or self._build_content_requirements()
+        }
+    
+    def _build_content_requirements(self) -> Dict[str, Any]:
+        """Build the content requirements shared by every insight in a run"""
+        return {
+            "brand_voice": self._get_brand_voice(),
+            "max_pieces": 5,
+            "content_mix": self._content_mix
         }
     
+    def _get_brand_voice(self) -> Dict[str, Any]:
+        """Return the brand voice configuration, reloading it only when the file has changed"""
+        mtime = (self.file_manager.memory_dir / "brand_voice.json").stat().st_mtime
+        
+        with self._lock:
+            if self._brand_voice_cache is None or mtime != self._brand_voice_mtime:
+                self._brand_voice_cache = self.file_manager.load_brand_voice()
+                self._brand_voice_mtime = mtime
+            return self._brand_voice_cache
+    
     def _create_publishing_task(self, episode_id: str, content_results: Dict[str, Any]) -> Dict[str, Any]:
         """Create publishing task for the publishing agent"""
         return {
-            "type": "schedule_content",
+            **self._PUBLISHING_TASK_TEMPLATE,
             "episode_id": episode_id,
             "content_pieces": content_results.get("content_pieces", []),
-            "publishing_config": self.config.get("publishing", {})
+            "publishing_config": self._publishing_config
         }
     
     def _determine_research_angle(self, insight: Dict[str, Any]) -> str:
         """Determine the best research angle for an insight"""
-        insight_type = insight.get("type", "")
-        
-        if insight_type == "contrarian_take":
-            return "supporting_evidence"
-        elif insight_type == "framework":
-            return "implementation_examples"
-        elif insight_type == "case_study":
-            return "similar_cases"
-        else:
-            return "general_research"
+        return _RESEARCH_ANGLE_BY_TYPE.get(insight.get("type", ""), "general_research")
     
     def _validate_insight_structure(self, insight: Dict[str, Any]) -> bool:
         """Validate that an insight has the required structure"""
-        required_fields = ["title", "type", "content"]
-        optional_fields = ["key_terms", "business_context", "steps", "contrarian_angle"]
-        
-        # Check required fields
-        if not all(field in insight for field in required_fields):
-            return False
-        
-        # Validate insight type
-        valid_types = ["framework", "contrarian_take", "case_study", "tactical_tip"]
-        if insight.get("type") not in valid_types:
-            return False
-        
-        return True
+        return (
+            isinstance(insight, dict)
+            and _REQUIRED_INSIGHT_FIELDS.issubset(insight)
+            and insight.get("type") in _VALID_INSIGHT_TYPES
+        )
     
     def _fallback_prioritization(self, insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Fallback prioritization using simple scoring"""
-        scoring_criteria = {
-            "framework_clarity": 0.3,
-            "contrarian_potential": 0.25,
-            "sme_relevance": 0.25,
-            "content_variety": 0.2
-        }
-        
         for insight in insights:
             # Simple scoring based on available data
             score = 0.5  # Base score
             
-            if insight.get("type") == "framework":
-                score += 0.2
+            score += _PRIORITY_BOOST_BY_TYPE.get(insight.get("type"), 0.0)
             if insight.get("contrarian_angle"):
                 score += 0.2
             if len(insight.get("key_terms", [])) >= 3:
@@ -389,5 +794,6 @@ class CMOOrchestrator(BaseAgent):
             
             insight["priority_score"] = min(score, 1.0)
         
-        # Sort by priority score, highest first
-        return sorted(insights, key=lambda x: x.get("priority_score", 0), reverse=True)
\ No newline at end of file
+        # Sort by priority score, highest first (every insight was just scored)
+        insights.sort(key=itemgetter("priority_score"), reverse=True)
+        return insights
\ No newline at end of file
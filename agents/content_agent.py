@@ -1,16 +1,68 @@
+import hashlib
 import json
-from typing import List, Dict, Any
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from statistics import fmean
+from typing import List, Dict, Any, Optional
 from agents.base_agent import BaseAgent
 from config.prompts.content_prompts import (
     CONTENT_SYSTEM_PROMPT,
-    FRAMEWORK_THREAD_PROMPT,
-    CONTRARIAN_TWEET_PROMPT, 
-    CASE_STUDY_CONTENT_PROMPT,
-    TACTICAL_TIP_PROMPT,
-    BRAND_VOICE_VALIDATION_PROMPT
+    BRAND_VOICE_VALIDATION_PROMPT,
+    BRAND_VOICE_VALIDATION_BATCH_PROMPT,
+    FRAMEWORK_THREAD_TEMPLATE,
+    CONTRARIAN_TWEET_TEMPLATE,
+    CASE_STUDY_CONTENT_TEMPLATE,
+    TACTICAL_TIP_TEMPLATE,
+    BRAND_VOICE_VALIDATION_TEMPLATE,
+    BRAND_VOICE_VALIDATION_BATCH_TEMPLATE
 )
+from utils import json_utils
 from utils.api_client import OpenRouterClient, ModelRouter, ContentGenerationError
 
+_REQUIRED_TASK_FIELDS = frozenset(("insight", "research_data"))
+_REQUIRED_THREAD_FIELDS = frozenset(("hook_tweet", "thread_tweets"))
+
+# Heuristic brand voice signals used when model validation is unavailable
+CONTRARIAN_PHRASES = ("most SMEs are wrong", "unpopular opinion", "conventional wisdom")
+_CONTRARIAN_PHRASE_RE = re.compile("|".join(map(re.escape, CONTRARIAN_PHRASES)), re.IGNORECASE)
+_DATA_POINT_RE = re.compile(r"\d+%|\$\d+|\d+x")
+
+# Fields of a content piece the brand voice validator actually evaluates
+_VALIDATION_FIELDS = ("type", "content_subtype", "content")
+
+# Character shingle size for near-duplicate fingerprints; short tweets change too
+# many word shingles per edit for word-level fingerprints to be useful
+_SHINGLE_SIZE = 5
+_WORD_RE = re.compile(r"\w+")
+
+# Research sections substituted into several generation prompts
+_SHARED_RESEARCH_SECTIONS = ("key_findings", "case_studies", "supporting_data")
+
+# Output budgets for the single-tweet generators: up to three pieces of roughly
+# 250-300 tokens each (tweet text plus its supporting fields) and a small overhead
+CONTRARIAN_MAX_TOKENS = 900
+TACTICAL_MAX_TOKENS = 1000
+
+# Output budget for batch validation: a fixed overhead plus room for each piece's result
+VALIDATION_BATCH_BASE_TOKENS = 200
+VALIDATION_TOKENS_PER_PIECE = 350
+
+
+def _simhash(text: str) -> int:
+    """64-bit SimHash over character shingles of the normalized text; similar texts differ in few bits"""
+    normalized = " ".join(_WORD_RE.findall(text.lower()))
+    shingles = [normalized[i:i + _SHINGLE_SIZE] for i in range(max(1, len(normalized) - _SHINGLE_SIZE + 1))]
+    
+    weights = [0] * 64
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
 
 class ContentAgent(BaseAgent):
     """
@@ -37,17 +89,36 @@ class ContentAgent(BaseAgent):
         self.max_tweet_length = config.get("content", {}).get("max_tweet_length", 280)
         self.content_mix = config.get("content", {}).get("content_mix", {})
         self.thread_length_range = config.get("content", {}).get("thread_length_range", [5, 7])
+        self.generation_workers = max(1, config.get("content", {}).get("generation_workers", 4))
         self.quality_threshold = 0.7  # Minimum quality score for approval
         self.brand_voice_threshold = 0.8  # Minimum brand voice score
+        
+        # Validation results keyed by piece hash: in-process LRU in front of a disk cache.
+        # The fingerprint covers the brand voice, prompts and threshold, so editing any starts afresh
+        cache_config = config.get("cache", {})
+        self.validation_cache_enabled = cache_config.get("enable_validation_cache", True)
+        self._validation_cache_size = cache_config.get("validation_memory_entries", 512)
+        self.validation_cache_ttl_seconds = cache_config.get("validation_cache_ttl_days", 30) * 86400
+        self._validation_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._validation_cache_lock = threading.Lock()
+        
+        # Recent (SimHash, piece type) -> validation result, for reusing near-identical drafts
+        self._near_duplicate_distance = cache_config.get("near_duplicate_max_distance", 3)
+        self._near_duplicate_size = cache_config.get("near_duplicate_entries", 256)
+        self._near_duplicates: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._validation_fingerprint = hashlib.blake2b(
+            "\x1f".join((
+                json.dumps(self.brand_voice, sort_keys=True, default=str),
+                BRAND_VOICE_VALIDATION_PROMPT,
+                BRAND_VOICE_VALIDATION_BATCH_PROMPT,
+                str(self.brand_voice_threshold)
+            )).encode("utf-8"),
+            digest_size=8
+        ).hexdigest()
     
     def _clean_json_response(self, response: str) -> str:
         """Clean Claude's response by removing markdown code blocks"""
-        cleaned_response = response.strip()
-        if cleaned_response.startswith('```json'):
-            cleaned_response = cleaned_response.replace('```json', '').replace('```', '').strip()
-        elif cleaned_response.startswith('```'):
-            cleaned_response = cleaned_response.replace('```', '').strip()
-        return cleaned_response
+        return json_utils.strip_code_fences(response)
     
     def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process content generation task"""
@@ -63,8 +134,7 @@ class ContentAgent(BaseAgent):
     
     def validate_input(self, task: Dict[str, Any]) -> bool:
         """Validate content generation task input"""
-        required_fields = ["insight", "research_data"]
-        return all(field in task for field in required_fields)
+        return _REQUIRED_TASK_FIELDS.issubset(task)
     
     def generate_social_content(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Generate multiple social media content pieces from insight and research"""
@@ -72,50 +142,67 @@ class ContentAgent(BaseAgent):
         research_data = task["research_data"]
         content_requirements = task.get("content_requirements", {})
         
+        insight_id = insight.get("id", "unknown_id")
         insight_type = insight.get("type", "unknown")
         self.log_decision("content_generation_started", 
-                         {"insight_id": insight.get("id", "unknown_id"), "insight_type": insight_type}, 
+                         {"insight_id": insight_id, "insight_type": insight_type}, 
                          "beginning_content_creation")
         
         try:
             content_pieces = []
             generation_metadata = {
-                "insight_id": insight.get("id", "unknown_id"),
+                "insight_id": insight_id,
                 "insight_type": insight_type,
                 "content_types_generated": [],
                 "total_pieces": 0,
                 "quality_scores": []
             }
             
-            # Generate content based on insight type and content mix preferences
-            if insight.get("type") == "framework" and self.content_mix.get("threads", 0) > 0:
-                framework_content = self.generate_framework_thread(insight, research_data)
-                if framework_content:
-                    content_pieces.append(framework_content)
-                    generation_metadata["content_types_generated"].append("framework_thread")
-            
-            # Generate contrarian content
-            if insight.get("contrarian_angle") and self.content_mix.get("single_tweets", 0) > 0:
-                contrarian_content = self.generate_contrarian_content(insight, research_data)
-                content_pieces.extend(contrarian_content)
-                generation_metadata["content_types_generated"].append("contrarian_tweets")
-            
-            # Generate case study content if research has case studies
-            if research_data.get("case_studies") and self.content_mix.get("single_tweets", 0) > 0:
-                case_study_content = self.generate_case_study_content(insight, research_data)
-                content_pieces.extend(case_study_content)
-                generation_metadata["content_types_generated"].append("case_study_content")
-            
-            # Generate tactical tips
-            tactical_content = self.generate_tactical_content(insight, research_data)
-            content_pieces.extend(tactical_content)
-            generation_metadata["content_types_generated"].append("tactical_tips")
-            
-            # Validate all content for brand voice and quality
+            # Pick the generators based on insight type and content mix preferences
+            wants_threads = self.content_mix.get("threads", 0) > 0
+            wants_single_tweets = self.content_mix.get("single_tweets", 0) > 0
+            
+            generators = []
+            if insight_type == "framework" and wants_threads:
+                generators.append(("framework_thread", self.generate_framework_thread))
+            
+            # Contrarian content
+            if insight.get("contrarian_angle") and wants_single_tweets:
+                generators.append(("contrarian_tweets", self.generate_contrarian_content))
+            
+            # Case study content if research has case studies
+            if research_data.get("case_studies") and wants_single_tweets:
+                generators.append(("case_study_content", self.generate_case_study_content))
+            
+            # Tactical tips
+            generators.append(("tactical_tips", self.generate_tactical_content))
+            
+            # Research sections are shared between prompts, so serialize them once
+            prompt_blocks = self._serialize_prompt_blocks(insight, research_data)
+            
+            # The generation calls are independent network round-trips, so run them
+            # concurrently; results are collected in the order above
+            workers = min(len(generators), self.generation_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    (content_type, executor.submit(generator, insight, research_data, prompt_blocks))
+                    for content_type, generator in generators
+                ]
+                for content_type, future in futures:
+                    generated = future.result()
+                    if content_type == "framework_thread":
+                        # A thread is a single piece, or None when generation failed
+                        if not generated:
+                            continue
+                        content_pieces.append(generated)
+                    else:
+                        content_pieces.extend(generated)
+                    generation_metadata["content_types_generated"].append(content_type)
+            
+            # Validate all content for brand voice and quality in a single call
             validated_content = []
-            for piece in content_pieces:
-                validation_result = self.validate_content_quality(piece)
-                
+            validation_results = self.validate_content_quality_batch(content_pieces)
+            for piece, validation_result in zip(content_pieces, validation_results):
                 if validation_result["approved"]:
                     piece["quality_validation"] = validation_result
                     validated_content.append(piece)
@@ -127,36 +214,33 @@ class ContentAgent(BaseAgent):
                                     "quality_threshold_not_met")
             
             generation_metadata["total_pieces"] = len(validated_content)
-            generation_metadata["avg_quality_score"] = (
-                sum(generation_metadata["quality_scores"]) / len(generation_metadata["quality_scores"])
-                if generation_metadata["quality_scores"] else 0
-            )
+            quality_scores = generation_metadata["quality_scores"]
+            generation_metadata["avg_quality_score"] = fmean(quality_scores) if quality_scores else 0
             
             self.log_decision("content_generation_completed",
-                            {"insight_id": insight.get("id", "unknown_id"), 
+                            {"insight_id": insight_id, 
                              "pieces_generated": len(validated_content),
                              "avg_quality": generation_metadata["avg_quality_score"]},
                             "content_creation_successful")
             
             # Update performance metrics
-            self.update_performance_metrics("insights_processed", 
-                                          self.memory.get("performance_metrics", {}).get("insights_processed", 0) + 1)
+            self.increment_performance_metric("insights_processed")
             self.update_performance_metrics("avg_pieces_per_insight", 
                                           len(validated_content))
             
             # Learn from successful content patterns
             if len(validated_content) >= 3:
                 self.learn_from_success({
-                    "insight_type": insight.get("type", "unknown"),
+                    "insight_type": insight_type,
                     "content_types": generation_metadata["content_types_generated"],
                     "pieces_count": len(validated_content),
                     "avg_quality": generation_metadata["avg_quality_score"]
                 })
             
-            self.save_memory()
+            self.save_memory_async()
             
             return {
-                "insight_id": insight.get("id", "unknown_id"),
+                "insight_id": insight_id,
                 "content_pieces": validated_content,
                 "generation_metadata": generation_metadata,
                 "status": "completed"
@@ -164,31 +248,34 @@ class ContentAgent(BaseAgent):
             
         except Exception as e:
             self.log_decision("content_generation_failed", 
-                            {"insight_id": insight.get("id", "unknown_id"), "error": str(e)}, 
+                            {"insight_id": insight_id, "error": str(e)}, 
                             "content_creation_failed")
             
             # Learn from failure
             self.learn_from_failure({
-                "insight_type": insight["type"],
+                "insight_type": insight_type,
                 "error_type": type(e).__name__,
                 "error_message": str(e)
             })
             
             return {
-                "insight_id": insight.get("id", "unknown_id"),
+                "insight_id": insight_id,
                 "content_pieces": [],
                 "error": str(e),
                 "status": "failed"
             }
     
-    def generate_framework_thread(self, insight: Dict[str, Any], research_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate_framework_thread(self, insight: Dict[str, Any], research_data: Dict[str, Any],
+                                  prompt_blocks: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Generate Twitter thread breaking down business framework"""
         try:
-            prompt = FRAMEWORK_THREAD_PROMPT.format(
-                framework_title=insight.get("title", "Unknown"),
-                framework_steps=json.dumps(insight.get("steps", [])),
-                supporting_research=json.dumps(research_data.get("key_findings", [])),
-                case_studies=json.dumps(research_data.get("case_studies", []))
+            framework_title = insight.get("title", "Unknown")
+            blocks = prompt_blocks or self._serialize_prompt_blocks(insight, research_data)
+            prompt = FRAMEWORK_THREAD_TEMPLATE.render(
+                framework_title=framework_title,
+                framework_steps=blocks["steps"],
+                supporting_research=blocks["key_findings"],
+                case_studies=blocks["case_studies"]
             )
             
             response = self.model_router.generate_content(
@@ -202,8 +289,8 @@ class ContentAgent(BaseAgent):
             # Parse thread response
             try:
                 cleaned_response = self._clean_json_response(response)
-                thread_data = json.loads(cleaned_response)
-            except json.JSONDecodeError:
+                thread_data = json_utils.loads(cleaned_response)
+            except json_utils.JSONDecodeError:
                 self.logger.log_error("thread_parse_error", "Failed to parse thread response", 
                                     {"response": response[:500]})
                 return None
@@ -217,7 +304,7 @@ class ContentAgent(BaseAgent):
                     "tweet_count": len(thread_data["thread_tweets"]) + 1,
                     "engagement_elements": thread_data.get("engagement_elements", []),
                     "metadata": {
-                        "framework_title": insight.get("title", "Unknown"),
+                        "framework_title": framework_title,
                         "character_counts": thread_data.get("character_counts", []),
                         "estimated_engagement": "high"  # Framework threads typically perform well
                     }
@@ -231,30 +318,32 @@ class ContentAgent(BaseAgent):
             self.logger.log_error("framework_thread_error", str(e))
             return None
     
-    def generate_contrarian_content(self, insight: Dict[str, Any], research_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def generate_contrarian_content(self, insight: Dict[str, Any], research_data: Dict[str, Any],
+                                    prompt_blocks: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """Generate contrarian content that challenges conventional wisdom"""
         try:
-            prompt = CONTRARIAN_TWEET_PROMPT.format(
+            blocks = prompt_blocks or self._serialize_prompt_blocks(insight, research_data)
+            prompt = CONTRARIAN_TWEET_TEMPLATE.render(
                 insight_title=insight.get("title", "Unknown"),
                 contrarian_angle=insight.get("contrarian_angle", ""),
-                supporting_data=json.dumps(research_data.get("supporting_data", [])),
-                case_examples=json.dumps(research_data.get("case_studies", []))
+                supporting_data=blocks["supporting_data"],
+                case_examples=blocks["case_studies"]
             )
             
             response = self.model_router.generate_content(
                 task_type="contrarian_content",
                 system_prompt=CONTENT_SYSTEM_PROMPT,
                 user_prompt=prompt,
-                max_tokens=1500,
+                max_tokens=CONTRARIAN_MAX_TOKENS,
                 agent_name="content_agent"
             )
             
             # Parse contrarian content response
             try:
                 cleaned_response = self._clean_json_response(response)
-                contrarian_data = json.loads(cleaned_response)
+                contrarian_data = json_utils.loads(cleaned_response)
                 contrarian_pieces = contrarian_data.get("contrarian_pieces", [])
-            except json.JSONDecodeError:
+            except json_utils.JSONDecodeError:
                 self.logger.log_error("contrarian_parse_error", "Failed to parse contrarian content response", 
                                     {"response": response[:500]})
                 return []
@@ -262,7 +351,8 @@ class ContentAgent(BaseAgent):
             # Convert to standard content format
             formatted_pieces = []
             for piece in contrarian_pieces:
-                if piece.get("character_count", 0) <= self.max_tweet_length:
+                # Measure the text itself; the model's own character_count is unreliable
+                if self._fits_tweet(piece.get("content", "")):
                     formatted_piece = {
                         "type": "single_tweet",
                         "content_subtype": piece["type"],
@@ -281,15 +371,17 @@ class ContentAgent(BaseAgent):
             self.logger.log_error("contrarian_content_error", str(e))
             return []
     
-    def generate_case_study_content(self, insight: Dict[str, Any], research_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def generate_case_study_content(self, insight: Dict[str, Any], research_data: Dict[str, Any],
+                                    prompt_blocks: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """Generate content highlighting case studies and examples"""
         case_studies = research_data.get("case_studies", [])
         if not case_studies:
             return []
         
         try:
-            prompt = CASE_STUDY_CONTENT_PROMPT.format(
-                case_studies=json.dumps(case_studies),
+            blocks = prompt_blocks or self._serialize_prompt_blocks(insight, research_data)
+            prompt = CASE_STUDY_CONTENT_TEMPLATE.render(
+                case_studies=blocks["case_studies"],
                 business_principle=insight.get("title", "Unknown"),
                 key_learning=insight.get("content", "")
             )
@@ -305,9 +397,9 @@ class ContentAgent(BaseAgent):
             # Parse case study content
             try:
                 cleaned_response = self._clean_json_response(response)
-                case_study_data = json.loads(cleaned_response)
+                case_study_data = json_utils.loads(cleaned_response)
                 case_study_pieces = case_study_data.get("case_study_content", [])
-            except json.JSONDecodeError:
+            except json_utils.JSONDecodeError:
                 self.logger.log_error("case_study_parse_error", "Failed to parse case study content response", 
                                     {"response": response[:500]})
                 return []
@@ -315,7 +407,8 @@ class ContentAgent(BaseAgent):
             # Format case study content
             formatted_pieces = []
             for piece in case_study_pieces:
-                if piece.get("character_count", 0) <= self.max_tweet_length:
+                # Measure the text itself; the model's own character_count is unreliable
+                if self._fits_tweet(piece.get("content", "")):
                     formatted_piece = {
                         "type": "single_tweet",
                         "content_subtype": piece["type"],
@@ -335,12 +428,14 @@ class ContentAgent(BaseAgent):
             self.logger.log_error("case_study_content_error", str(e))
             return []
     
-    def generate_tactical_content(self, insight: Dict[str, Any], research_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def generate_tactical_content(self, insight: Dict[str, Any], research_data: Dict[str, Any],
+                                  prompt_blocks: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
         """Generate tactical, actionable tips for SME owners"""
         try:
-            prompt = TACTICAL_TIP_PROMPT.format(
+            blocks = prompt_blocks or self._serialize_prompt_blocks(insight, research_data)
+            prompt = TACTICAL_TIP_TEMPLATE.render(
                 insight_content=insight.get("content", ""),
-                research_data=json.dumps(research_data.get("key_findings", [])),
+                research_data=blocks["key_findings"],
                 sme_context=insight.get("business_context", "")
             )
             
@@ -348,16 +443,16 @@ class ContentAgent(BaseAgent):
                 task_type="tactical_content",
                 system_prompt=CONTENT_SYSTEM_PROMPT,
                 user_prompt=prompt,
-                max_tokens=1200,
+                max_tokens=TACTICAL_MAX_TOKENS,
                 agent_name="content_agent"
             )
             
             # Parse tactical tips
             try:
                 cleaned_response = self._clean_json_response(response)
-                tactical_data = json.loads(cleaned_response)
+                tactical_data = json_utils.loads(cleaned_response)
                 tactical_tips = tactical_data.get("tactical_tips", [])
-            except json.JSONDecodeError:
+            except json_utils.JSONDecodeError:
                 self.logger.log_error("tactical_parse_error", "Failed to parse tactical content response", 
                                     {"response": response[:500]})
                 return []
@@ -365,7 +460,7 @@ class ContentAgent(BaseAgent):
             # Format tactical content
             formatted_pieces = []
             for tip in tactical_tips:
-                if tip.get("character_count", 0) <= self.max_tweet_length:
+                if self._fits_tweet(tip.get("tip_content", "")):
                     formatted_piece = {
                         "type": "single_tweet",
                         "content_subtype": "tactical_tip",
@@ -385,11 +480,28 @@ class ContentAgent(BaseAgent):
             self.logger.log_error("tactical_content_error", str(e))
             return []
     
+    def _validate_individually(self, content_pieces: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate pieces with concurrent single-piece calls, keeping input order"""
+        workers = min(len(content_pieces), self.generation_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.validate_content_quality, content_pieces))
+    
+    def _serialize_prompt_blocks(self, insight: Dict[str, Any], research_data: Dict[str, Any]) -> Dict[str, str]:
+        """Serialize the insight steps and shared research sections once for all generation prompts"""
+        blocks = {section: json_utils.dumps(research_data.get(section, [])) for section in _SHARED_RESEARCH_SECTIONS}
+        blocks["steps"] = json_utils.dumps(insight.get("steps", []))
+        return blocks
+    
     def validate_content_quality(self, content_piece: Dict[str, Any]) -> Dict[str, Any]:
         """Validate content against brand voice and quality standards"""
+        cache_key = self._validation_cache_key(content_piece)
+        cached = self._get_cached_validation(cache_key, content_piece)
+        if cached is not None:
+            return cached
+        
         try:
-            prompt = BRAND_VOICE_VALIDATION_PROMPT.format(
-                content=json.dumps(content_piece, indent=2)
+            prompt = BRAND_VOICE_VALIDATION_TEMPLATE.render(
+                content=json_utils.dumps(self._validation_payload(content_piece))
             )
             
             # Brand voice validation uses Claude via OpenRouter for consistency
@@ -404,33 +516,195 @@ class ContentAgent(BaseAgent):
             # Parse validation response
             try:
                 cleaned_response = self._clean_json_response(response)
-                validation_result = json.loads(cleaned_response)
-            except json.JSONDecodeError:
+                validation_result = json_utils.loads(cleaned_response)
+            except json_utils.JSONDecodeError:
                 self.logger.log_error("validation_parse_error", "Failed to parse validation response", 
                                     {"response": response[:500]})
-                # Fallback validation
-                validation_result = self._fallback_validation(content_piece)
-            
-            # Determine approval based on thresholds
-            brand_score = validation_result.get("brand_voice_score", 0)
-            approved = (
-                brand_score >= self.brand_voice_threshold and
-                validation_result.get("approval_recommendation") != "rejected"
-            )
-            
-            validation_result["approved"] = approved
-            validation_result["brand_voice_threshold_met"] = brand_score >= self.brand_voice_threshold
+                # Fallback validation (heuristic results are never cached)
+                return self._apply_approval(self._fallback_validation(content_piece))
             
+            validation_result = self._apply_approval(validation_result)
+            self._store_validation(cache_key, validation_result, content_piece)
             return validation_result
             
         except Exception as e:
             self.logger.log_error("content_validation_error", str(e))
             return self._fallback_validation(content_piece)
     
+    def validate_content_quality_batch(self, content_pieces: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate several content pieces in one model call, returning results in input order"""
+        cache_keys = [self._validation_cache_key(piece) for piece in content_pieces]
+        results = [self._get_cached_validation(key, piece) for key, piece in zip(cache_keys, content_pieces)]
+        
+        # Only pieces without a cached result go to the model
+        pending = [index for index, result in enumerate(results) if result is None]
+        if len(pending) == 1:
+            results[pending[0]] = self.validate_content_quality(content_pieces[pending[0]])
+        elif pending:
+            fresh_results = self._request_batch_validation(
+                [content_pieces[index] for index in pending],
+                [cache_keys[index] for index in pending]
+            )
+            for index, result in zip(pending, fresh_results):
+                results[index] = result
+        
+        return results
+    
+    def _request_batch_validation(self, content_pieces: List[Dict[str, Any]], 
+                                  cache_keys: List[str]) -> List[Dict[str, Any]]:
+        """Send a single batch validation request for pieces that aren't cached"""
+        try:
+            prompt = BRAND_VOICE_VALIDATION_BATCH_TEMPLATE.render(
+                content_pieces=json_utils.dumps([
+                    {"index": index, **self._validation_payload(piece)}
+                    for index, piece in enumerate(content_pieces)
+                ])
+            )
+            
+            response = self.model_router.generate_content(
+                task_type="brand_voice_validation",
+                system_prompt=CONTENT_SYSTEM_PROMPT,
+                user_prompt=prompt,
+                max_tokens=VALIDATION_BATCH_BASE_TOKENS + VALIDATION_TOKENS_PER_PIECE * len(content_pieces),
+                agent_name="content_agent"
+            )
+            
+            try:
+                cleaned_response = self._clean_json_response(response)
+                batch_results = json_utils.loads(cleaned_response).get("results", [])
+            except (json_utils.JSONDecodeError, AttributeError):
+                self.logger.log_error("validation_parse_error", "Failed to parse batch validation response", 
+                                    {"response": response[:500], "pieces": len(content_pieces)})
+                return self._validate_individually(content_pieces)
+            
+            # Models sometimes echo the index as a string, so coerce before matching
+            results_by_index = {}
+            for result in batch_results:
+                try:
+                    results_by_index[int(result["index"])] = result
+                except (TypeError, ValueError, KeyError):
+                    continue
+            
+            missing_count = sum(1 for index in range(len(content_pieces)) if index not in results_by_index)
+            if missing_count:
+                self.logger.log_error("validation_batch_incomplete", "Batch validation response skipped pieces", 
+                                    {"missing": missing_count, "pieces": len(content_pieces)})
+            
+            # Pieces the model skipped get the heuristic fallback rather than a second call
+            validation_results = []
+            for index, piece in enumerate(content_pieces):
+                if index in results_by_index:
+                    validation_result = self._apply_approval(results_by_index[index])
+                    self._store_validation(cache_keys[index], validation_result, piece)
+                else:
+                    validation_result = self._fallback_validation(piece)
+                validation_results.append(validation_result)
+            
+            return validation_results
+            
+        except Exception as e:
+            self.logger.log_error("content_validation_error", str(e), {"pieces": len(content_pieces)})
+            return [self._fallback_validation(piece) for piece in content_pieces]
+    
+    def _validation_payload(self, content_piece: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce a content piece to the fields the validator needs; threads are sent as joined text"""
+        payload = {field: content_piece[field] for field in _VALIDATION_FIELDS if field in content_piece}
+        if "thread_tweets" in content_piece:
+            payload["content"] = "\n\n".join(content_piece["thread_tweets"])
+        return payload
+    
+    def _validation_cache_key(self, content_piece: Dict[str, Any]) -> str:
+        """Hash a content piece together with the current brand voice fingerprint"""
+        serialized = json_utils.dumps(self._validation_payload(content_piece))
+        return hashlib.blake2b(
+            f"{self._validation_fingerprint}\x1f{serialized}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+    
+    def _get_cached_validation(self, cache_key: str, content_piece: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached validation result, checking memory, disk, then near duplicates"""
+        if not self.validation_cache_enabled:
+            return None
+        
+        with self._validation_cache_lock:
+            result = self._validation_cache.get(cache_key)
+            if result is not None:
+                self._validation_cache.move_to_end(cache_key)
+        
+        if result is None:
+            cached = self.file_manager.load_cached_response("validation", cache_key,
+                                                            max_age_seconds=self.validation_cache_ttl_seconds)
+            try:
+                result = json_utils.loads(cached) if cached is not None else None
+            except json_utils.JSONDecodeError:
+                result = None
+            if result is None:
+                return self._find_near_duplicate(content_piece)
+            self._remember_validation(cache_key, result)
+        
+        self.increment_performance_metric("validation_cache_hits")
+        # Approval is re-derived so hits always follow the current threshold
+        return self._apply_approval(dict(result))
+    
+    def _find_near_duplicate(self, content_piece: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Reuse the validation of a recent piece of the same type whose text is nearly identical"""
+        fingerprint = _simhash(self._validation_payload(content_piece).get("content", ""))
+        piece_type = content_piece.get("type")
+        
+        with self._validation_cache_lock:
+            for key, result in self._near_duplicates.items():
+                if key[1] == piece_type and bin(key[0] ^ fingerprint).count("1") <= self._near_duplicate_distance:
+                    self._near_duplicates.move_to_end(key)
+                    break
+            else:
+                return None
+        
+        self.increment_performance_metric("validation_near_duplicate_hits")
+        return self._apply_approval(dict(result, dedup_source="near_duplicate"))
+    
+    def _store_validation(self, cache_key: str, validation_result: Dict[str, Any], content_piece: Dict[str, Any]):
+        """Cache a model-produced validation result in memory and on disk"""
+        if not self.validation_cache_enabled:
+            return
+        
+        self._remember_validation(cache_key, dict(validation_result))
+        
+        fingerprint = _simhash(self._validation_payload(content_piece).get("content", ""))
+        with self._validation_cache_lock:
+            self._near_duplicates[(fingerprint, content_piece.get("type"))] = dict(validation_result)
+            if len(self._near_duplicates) > self._near_duplicate_size:
+                self._near_duplicates.popitem(last=False)
+        
+        try:
+            self.file_manager.save_cached_response("validation", cache_key, json_utils.dumps(validation_result))
+        except (OSError, TypeError) as e:
+            self.logger.log_error("validation_cache_write_failed", str(e))
+    
+    def _remember_validation(self, cache_key: str, validation_result: Dict[str, Any]):
+        """Insert into the in-process LRU, evicting the least recently used entry"""
+        with self._validation_cache_lock:
+            self._validation_cache[cache_key] = validation_result
+            self._validation_cache.move_to_end(cache_key)
+            if len(self._validation_cache) > self._validation_cache_size:
+                self._validation_cache.popitem(last=False)
+    
+    def _apply_approval(self, validation_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Determine approval based on the brand voice threshold and the model's recommendation"""
+        brand_score = validation_result.get("brand_voice_score", 0)
+        validation_result["approved"] = (
+            brand_score >= self.brand_voice_threshold and
+            validation_result.get("approval_recommendation") != "rejected"
+        )
+        validation_result["brand_voice_threshold_met"] = brand_score >= self.brand_voice_threshold
+        
+        return validation_result
+    
+    def _fits_tweet(self, text: str) -> bool:
+        """Check that a generated tweet is non-empty and within the character limit"""
+        return 0 < len(text) <= self.max_tweet_length
+    
     def _validate_thread_structure(self, thread_data: Dict[str, Any]) -> bool:
         """Validate thread structure and character limits"""
-        required_fields = ["hook_tweet", "thread_tweets"]
-        if not all(field in thread_data for field in required_fields):
+        if not _REQUIRED_THREAD_FIELDS.issubset(thread_data):
             return False
         
         # Check tweet count is within range
@@ -454,13 +728,11 @@ class ContentAgent(BaseAgent):
         brand_score = 0.5  # Neutral score
         
         # Check for brand voice indicators
-        contrarian_phrases = ["most SMEs are wrong", "unpopular opinion", "conventional wisdom"]
-        if any(phrase.lower() in content.lower() for phrase in contrarian_phrases):
+        if _CONTRARIAN_PHRASE_RE.search(content):
             brand_score += 0.2
         
         # Check for specific data/numbers
-        import re
-        if re.search(r'\d+%|\$\d+|\d+x', content):
+        if _DATA_POINT_RE.search(content):
             brand_score += 0.1
         
         # Check length
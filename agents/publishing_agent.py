@@ -1,8 +1,25 @@
+import heapq
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from operator import attrgetter
+from typing import List, Dict, Any, Iterable, Iterator, Optional
 from agents.base_agent import BaseAgent
-from utils.api_client import TypefullyClient, PublishingError
+from utils.api_client import TypefullyClient, PublishingError, CircuitOpenError
+
+_REQUIRED_TASK_FIELDS = frozenset(("content_pieces",))
+
+
+@dataclass(slots=True)
+class ScheduleItem:
+    """A content piece paired with its publish slot"""
+    content: Dict[str, Any]
+    publish_time: datetime
+    priority: str
+    content_type: str
+    failed_at: Optional[datetime] = None
 
 
 class PublishingAgent(BaseAgent):
@@ -21,10 +38,30 @@ class PublishingAgent(BaseAgent):
         self.optimal_times = self.publishing_config.get("optimal_times", ["09:00", "14:00", "18:00"])
         self.avoid_weekends = self.publishing_config.get("avoid_weekends", True)
         self.min_thread_spacing_hours = self.publishing_config.get("min_thread_spacing_hours", 48)
+        self._min_thread_spacing_s = int(self.min_thread_spacing_hours * 3600)
+        self.schedule_workers = max(1, self.publishing_config.get("schedule_workers", 4))
+        
+        # Daily posting times parsed once, sorted so slots come out in time order
+        self._daily_times = sorted(
+            tuple(map(int, time_str.split(':')))
+            for time_str in self.optimal_times[:self.posts_per_day]
+        )
+        allowed_weekdays = range(5) if self.avoid_weekends else range(7)
+        
+        # Posting times per weekday (Monday = 0); skipped weekend days have none
+        self._slots_by_weekday = tuple(
+            tuple(self._daily_times) if weekday in allowed_weekdays else ()
+            for weekday in range(7)
+        )
+        
+        # Retry queue policy: past the threshold, new failures jump the queue so fresh
+        # content isn't starved by a backlog; entries older than the max age are dropped
+        self.retry_lifo_threshold = self.publishing_config.get("retry_lifo_threshold", 50)
+        self.retry_max_age = timedelta(hours=self.publishing_config.get("retry_max_age_hours", 72))
         
         # Content scheduling queue
         self.content_queue = []
-        self.retry_queue = []
+        self.retry_queue: "deque[ScheduleItem]" = deque()
     
     def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process publishing task"""
@@ -42,8 +79,7 @@ class PublishingAgent(BaseAgent):
     
     def validate_input(self, task: Dict[str, Any]) -> bool:
         """Validate publishing task input"""
-        required_fields = ["content_pieces"]
-        return all(field in task for field in required_fields)
+        return _REQUIRED_TASK_FIELDS.issubset(task)
     
     def schedule_content_pieces(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Schedule content pieces for publication via Typefully"""
@@ -64,39 +100,50 @@ class PublishingAgent(BaseAgent):
         
         try:
             # Create publishing schedule
-            publishing_schedule = self.create_publishing_schedule(content_pieces)
+            publishing_schedule = self.create_publishing_schedule(content_pieces, now=datetime.now())
             
-            # Schedule each piece of content
+            # Schedule each piece of content. The Typefully calls are independent
+            # network round-trips, so they run concurrently (the client's rate limiter
+            # is shared and thread-safe); results are handled in schedule order
             scheduled_content = []
             failed_content = []
+            next_publication = None
             
-            for schedule_item in publishing_schedule:
+            workers = min(len(publishing_schedule), self.schedule_workers) or 1
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self.schedule_single_content, item) for item in publishing_schedule]
+            
+            for schedule_item, future in zip(publishing_schedule, futures):
                 try:
-                    result = self.schedule_single_content(schedule_item)
+                    result = future.result()
                     if result["success"]:
                         scheduled_content.append(result)
+                        # The schedule is in time order, so the first success is the earliest
+                        if next_publication is None:
+                            next_publication = result["publish_time"]
+                        # The result already carries the ISO publish time, so reuse it
                         self.log_decision("content_scheduled", 
-                                        {"content_type": schedule_item["content"]["type"],
-                                         "publish_time": schedule_item["publish_time"].isoformat()}, 
+                                        {"content_type": schedule_item.content_type,
+                                         "publish_time": result["publish_time"]}, 
                                         "scheduled_successfully")
                     else:
                         failed_content.append({
-                            "content": schedule_item["content"],
+                            "content": schedule_item.content,
                             "error": result["error"],
                             "retry_scheduled": True
                         })
                         # Add to retry queue
-                        self.retry_queue.append(schedule_item)
+                        self._enqueue_retry(schedule_item)
                         
                 except Exception as e:
                     self.logger.log_error("scheduling_error", str(e), 
-                                        {"content_id": schedule_item["content"].get("id", "unknown")})
+                                        {"content_id": schedule_item.content.get("id", "unknown")})
                     failed_content.append({
-                        "content": schedule_item["content"],
+                        "content": schedule_item.content,
                         "error": str(e),
                         "retry_scheduled": True
                     })
-                    self.retry_queue.append(schedule_item)
+                    self._enqueue_retry(schedule_item)
             
             # Save publishing results
             publishing_summary = {
@@ -105,14 +152,13 @@ class PublishingAgent(BaseAgent):
                 "failed_count": len(failed_content),
                 "scheduled_content": scheduled_content,
                 "failed_content": failed_content,
-                "next_publication": (
-                    min([item["publish_time"] for item in scheduled_content])
-                    if scheduled_content else None
-                ),
+                "next_publication": next_publication,
                 "publishing_completed_at": datetime.now().isoformat()
             }
             
-            self.file_manager.save_published_content(episode_id, publishing_summary)
+            # Written in the background; the summary isn't touched again after this
+            self._submit_io("published_content_save", self.file_manager.save_published_content,
+                            episode_id, publishing_summary)
             
             self.log_decision("publishing_completed",
                             {"episode_id": episode_id, 
@@ -121,10 +167,16 @@ class PublishingAgent(BaseAgent):
                             "content_scheduling_finished")
             
             # Update performance metrics
-            self.update_performance_metrics("content_pieces_scheduled", 
-                                          self.memory.get("performance_metrics", {}).get("content_pieces_scheduled", 0) + len(scheduled_content))
-            self.update_performance_metrics("scheduling_success_rate", 
-                                          len(scheduled_content) / len(content_pieces) if content_pieces else 0)
+            with self._lock:
+                metrics = self._get_metrics()
+                scheduled_total = metrics.get("content_pieces_scheduled", 0) + len(scheduled_content)
+                success_rate = len(scheduled_content) / max(1, len(content_pieces))
+                metrics["content_pieces_scheduled"] = scheduled_total
+                metrics["scheduling_success_rate"] = success_rate
+                self._status_dirty = True
+            self.logger.log_info("Updated scheduling metrics",
+                                 {"content_pieces_scheduled": scheduled_total,
+                                  "scheduling_success_rate": success_rate})
             
             # Learn from publishing patterns
             if len(scheduled_content) >= len(content_pieces) * 0.8:  # 80% success rate
@@ -135,7 +187,7 @@ class PublishingAgent(BaseAgent):
                     "success_rate": len(scheduled_content) / len(content_pieces)
                 })
             
-            self.save_memory()
+            self.save_memory_async()
             
             return {
                 "episode_id": episode_id,
@@ -166,77 +218,107 @@ class PublishingAgent(BaseAgent):
                 "status": "failed"
             }
     
-    def create_publishing_schedule(self, content_pieces: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def create_publishing_schedule(self, content_pieces: List[Dict[str, Any]],
+                                   now: Optional[datetime] = None) -> List["ScheduleItem"]:
         """Create optimal publishing schedule for content pieces"""
-        schedule_items = []
+        # Separate content types for strategic scheduling in one pass
+        threads = []
+        single_tweets = []
+        for piece in content_pieces:
+            content_type = piece["type"]
+            if content_type == "thread":
+                threads.append(piece)
+            elif content_type == "single_tweet":
+                single_tweets.append(piece)
         
-        # Separate content types for strategic scheduling
-        threads = [piece for piece in content_pieces if piece["type"] == "thread"]
-        single_tweets = [piece for piece in content_pieces if piece["type"] == "single_tweet"]
-        
-        # Get available time slots for the next 7 days
-        time_slots = self.generate_optimal_time_slots()
-        
-        # Schedule threads first (higher priority, need more spacing)
-        thread_slots = self._select_thread_slots(time_slots, len(threads))
-        for i, thread in enumerate(threads[:len(thread_slots)]):
-            schedule_items.append({
-                "content": thread,
-                "publish_time": thread_slots[i],
-                "priority": "high",
-                "content_type": "thread"
-            })
+        # Get available time slots for the next 7 days as epoch seconds; they are
+        # converted back to datetimes only for the slots actually used
+        time_slots = list(self._iter_slot_epochs(now)) if threads or single_tweets else []
         
-        # Fill remaining slots with single tweets
-        used_slots = set(thread_slots)
-        remaining_slots = [slot for slot in time_slots if slot not in used_slots]
-        
-        for i, single_tweet in enumerate(single_tweets[:len(remaining_slots)]):
-            schedule_items.append({
-                "content": single_tweet,
-                "publish_time": remaining_slots[i],
-                "priority": "medium",
-                "content_type": "single_tweet"
-            })
+        if not threads:
+            # Singles only: no spacing pass or slot split needed
+            thread_items = []
+            single_items = self._build_schedule_items(single_tweets, time_slots, "medium", "single_tweet")
+        else:
+            # Schedule threads first (higher priority, need more spacing)
+            thread_slots = self._select_thread_slots(time_slots, len(threads))
+            thread_items = self._build_schedule_items(threads, thread_slots, "high", "thread")
+            
+            if not single_tweets:
+                single_items = []
+            else:
+                # Fill remaining slots with single tweets. Thread slots are an ordered
+                # subsequence of time_slots, so one pass splits out the rest in order
+                remaining_slots = []
+                thread_index = 0
+                for slot in time_slots:
+                    if thread_index < len(thread_slots) and slot == thread_slots[thread_index]:
+                        thread_index += 1
+                    else:
+                        remaining_slots.append(slot)
+                
+                single_items = self._build_schedule_items(single_tweets, remaining_slots,
+                                                          "medium", "single_tweet")
         
-        # Sort by publish time
-        schedule_items.sort(key=lambda x: x["publish_time"])
+        # Both lists are already in time order, so merge rather than sort
+        if thread_items and single_items:
+            schedule_items = list(heapq.merge(thread_items, single_items, key=attrgetter("publish_time")))
+        else:
+            schedule_items = thread_items or single_items
         
         self.log_decision("schedule_created", 
                          {"total_items": len(schedule_items),
                           "threads": len(threads),
-                          "single_tweets": len([item for item in schedule_items if item["content_type"] == "single_tweet"])},
+                          "single_tweets": len(single_items)},
                          "publishing_schedule_ready")
         
         return schedule_items
     
-    def generate_optimal_time_slots(self) -> List[datetime]:
+    def _build_schedule_items(self, pieces: List[Dict[str, Any]], slots: List[int],
+                              priority: str, content_type: str) -> List["ScheduleItem"]:
+        """Pair content pieces of one type with their slots, in slot order"""
+        return [
+            ScheduleItem(piece, datetime.fromtimestamp(slot), priority, content_type)
+            for piece, slot in zip(pieces, slots)
+        ]
+    
+    def generate_optimal_time_slots(self, now: Optional[datetime] = None) -> List[datetime]:
         """Generate optimal posting times for the next week"""
-        time_slots = []
-        current_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return list(self.iter_optimal_time_slots(now))
+    
+    def iter_optimal_time_slots(self, now: Optional[datetime] = None) -> Iterator[datetime]:
+        """Yield optimal posting times for the next week in time order"""
+        for epoch in self._iter_slot_epochs(now):
+            yield datetime.fromtimestamp(epoch)
+    
+    def _iter_slot_epochs(self, now: Optional[datetime] = None) -> Iterator[int]:
+        """Yield optimal posting times for the next week as epoch seconds, in time order"""
+        if now is None:
+            now = datetime.now()
+        
+        # Only schedule future times (at least 1 hour from now)
+        cutoff = now + timedelta(hours=1)
+        
+        current_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_weekday = current_date.weekday()
         
         for day_offset in range(7):  # Next 7 days
-            date = current_date + timedelta(days=day_offset)
-            
-            # Skip weekends if configured
-            if self.avoid_weekends and date.weekday() >= 5:  # Saturday = 5, Sunday = 6
+            # Days without posting times (skipped weekends) cost no date arithmetic
+            day_times = self._slots_by_weekday[(start_weekday + day_offset) % 7]
+            if not day_times:
                 continue
             
-            # Add optimal time slots for this day
-            for time_str in self.optimal_times[:self.posts_per_day]:
-                hour, minute = map(int, time_str.split(':'))
+            # Yield optimal time slots for this day
+            date = current_date + timedelta(days=day_offset)
+            for hour, minute in day_times:
                 slot_time = date.replace(hour=hour, minute=minute)
-                
-                # Only schedule future times (at least 1 hour from now)
-                if slot_time > datetime.now() + timedelta(hours=1):
-                    time_slots.append(slot_time)
-        
-        return sorted(time_slots)
+                if slot_time > cutoff:
+                    yield int(slot_time.timestamp())
     
-    def schedule_single_content(self, schedule_item: Dict[str, Any]) -> Dict[str, Any]:
+    def schedule_single_content(self, schedule_item: "ScheduleItem") -> Dict[str, Any]:
         """Schedule a single piece of content via Typefully"""
-        content = schedule_item["content"]
-        publish_time = schedule_item["publish_time"]
+        content = schedule_item.content
+        publish_time = schedule_item.publish_time
         
         try:
             if content["type"] == "thread":
@@ -262,6 +344,15 @@ class PublishingAgent(BaseAgent):
                 "typefully_response": result
             }
             
+        except CircuitOpenError as e:
+            # The breaker already logged when it opened; the item goes to the retry queue
+            return {
+                "success": False,
+                "content": content,
+                "publish_time": publish_time.isoformat(),
+                "error": str(e)
+            }
+        
         except PublishingError as e:
             self.logger.log_error("typefully_error", str(e), 
                                 {"content_type": content["type"], "publish_time": publish_time.isoformat()})
@@ -281,6 +372,15 @@ class PublishingAgent(BaseAgent):
                 "error": str(e)
             }
     
+    def _enqueue_retry(self, schedule_item: "ScheduleItem"):
+        """Queue a failed item for retry, newest first once the queue is backed up"""
+        if schedule_item.failed_at is None:
+            schedule_item.failed_at = datetime.now()
+        if len(self.retry_queue) > self.retry_lifo_threshold:
+            self.retry_queue.appendleft(schedule_item)
+        else:
+            self.retry_queue.append(schedule_item)
+    
     def retry_failed_publications(self) -> Dict[str, Any]:
         """Retry failed publications from the retry queue"""
         if not self.retry_queue:
@@ -296,42 +396,61 @@ class PublishingAgent(BaseAgent):
         
         successful_retries = []
         still_failed = []
+        expired_count = 0
+        now = datetime.now()
+        stale_before = now - self.retry_max_age
+        
+        # Slots are drawn lazily from one generator per batch; each successful retry
+        # takes the next free one, so retries no longer all land on the same first slot
+        available_slots = self.iter_optimal_time_slots(now)
+        next_slot = next(available_slots, None)
         
-        # Process retry queue
-        for schedule_item in self.retry_queue[:]:  # Create copy to avoid modification during iteration
+        # Process retry queue, rebuilding it from the items that still fail
+        remaining_queue = deque()
+        for schedule_item in self.retry_queue:
+            # Content that has waited too long is no longer timely enough to post
+            if schedule_item.failed_at is not None and schedule_item.failed_at < stale_before:
+                expired_count += 1
+                continue
+            
             try:
                 # Reschedule for next available slot
-                new_time_slots = self.generate_optimal_time_slots()
-                if new_time_slots:
-                    schedule_item["publish_time"] = new_time_slots[0]
+                if next_slot is not None:
+                    schedule_item.publish_time = next_slot
                     result = self.schedule_single_content(schedule_item)
                     
                     if result["success"]:
+                        next_slot = next(available_slots, None)
                         successful_retries.append(result)
-                        self.retry_queue.remove(schedule_item)
-                    else:
-                        still_failed.append(result)
+                        continue
+                    still_failed.append(result)
                 else:
                     still_failed.append({
-                        "content": schedule_item["content"],
+                        "content": schedule_item.content,
                         "error": "No available time slots for retry"
                     })
                     
             except Exception as e:
                 still_failed.append({
-                    "content": schedule_item["content"],
+                    "content": schedule_item.content,
                     "error": str(e)
                 })
+            
+            remaining_queue.append(schedule_item)
+        
+        self.retry_queue = remaining_queue
         
         self.log_decision("retry_publications_completed",
                          {"successful_retries": len(successful_retries),
-                          "still_failed": len(still_failed)},
+                          "still_failed": len(still_failed),
+                          "expired": expired_count},
                          "retry_process_finished")
         
         return {
             "retried_count": len(successful_retries) + len(still_failed),
             "successful_retries": len(successful_retries),
             "still_failed": len(still_failed),
+            "expired": expired_count,
             "successful_items": successful_retries,
             "failed_items": still_failed,
             "status": "completed"
@@ -340,16 +459,19 @@ class PublishingAgent(BaseAgent):
     def get_scheduled_content_status(self) -> Dict[str, Any]:
         """Get status of currently scheduled content"""
         try:
-            scheduled_posts = self.typefully_client.get_scheduled_posts()
-            drafts = self.typefully_client.get_drafts()
+            # Two independent round-trips, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                scheduled_future = executor.submit(self.typefully_client.get_scheduled_posts)
+                drafts_future = executor.submit(self.typefully_client.get_drafts)
+                scheduled_posts = scheduled_future.result()
+                drafts = drafts_future.result()
             
             return {
                 "scheduled_posts_count": len(scheduled_posts),
                 "drafts_count": len(drafts),
                 "retry_queue_length": len(self.retry_queue),
-                "next_scheduled_post": (
-                    min([post.get("scheduled_time", "") for post in scheduled_posts])
-                    if scheduled_posts else None
+                "next_scheduled_post": min(
+                    (post.get("scheduled_time", "") for post in scheduled_posts), default=None
                 ),
                 "status": "healthy"
             }
@@ -362,18 +484,20 @@ class PublishingAgent(BaseAgent):
                 "status": "error"
             }
     
-    def _select_thread_slots(self, time_slots: List[datetime], thread_count: int) -> List[datetime]:
-        """Select optimal time slots for threads with proper spacing"""
-        if not time_slots or thread_count == 0:
+    def _select_thread_slots(self, time_slots: Iterable[int], thread_count: int) -> List[int]:
+        """Select optimal time slots (epoch seconds) for threads with proper spacing"""
+        if thread_count == 0:
             return []
         
         selected_slots = []
-        min_spacing = timedelta(hours=self.min_thread_spacing_hours)
+        min_spacing = self._min_thread_spacing_s
         
+        # Slots are sorted, so a candidate only needs spacing from the last slot taken
+        last_selected = None
         for slot in time_slots:
-            # Check if this slot has proper spacing from already selected slots
-            if not selected_slots or all(abs(slot - selected) >= min_spacing for selected in selected_slots):
+            if last_selected is None or slot - last_selected >= min_spacing:
                 selected_slots.append(slot)
+                last_selected = slot
                 
                 # Stop when we have enough slots
                 if len(selected_slots) >= thread_count:
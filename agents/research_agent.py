@@ -1,13 +1,36 @@
-import json
-from typing import List, Dict, Any
+import hashlib
+import heapq
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple
 from agents.base_agent import BaseAgent
+from agents.research_types import ResearchMetadata, ResearchPackage
 from config.prompts.research_prompts import (
     RESEARCH_SYSTEM_PROMPT, 
-    SEARCH_QUERY_GENERATION_PROMPT, 
-    RESEARCH_ANALYSIS_PROMPT
+    SEARCH_QUERY_GENERATION_TEMPLATE,
+    RESEARCH_ANALYSIS_TEMPLATE
 )
+from utils import json_utils
 from utils.api_client import OpenRouterClient, ModelRouter, WebSearchClient, ContentGenerationError
 
+_REQUIRED_TASK_FIELDS = frozenset(("insight", "research_angle"))
+
+# Search results whose snippets overlap this much (Jaccard over word shingles) are duplicates
+_SNIPPET_DUPLICATE_JACCARD = 0.9
+_SNIPPET_SHINGLE_SIZE = 5
+
+# Results scored this far below the credibility threshold are not worth sending for analysis
+_CREDIBILITY_PREFILTER_MARGIN = 0.1
+_WORD_RE = re.compile(r"\w+")
+
+# Extra fallback search query per research angle ({term} is the insight's lead term)
+_FALLBACK_QUERY_BY_ANGLE = {
+    "supporting_evidence": "{term} benefits statistics SME",
+    "contrarian_examples": "{term} failure risks small business"
+}
+
 
 class ResearchAgent(BaseAgent):
     """
@@ -31,6 +54,18 @@ class ResearchAgent(BaseAgent):
         self.max_searches_per_insight = config.get("research", {}).get("max_searches_per_insight", 3)
         self.credibility_threshold = config.get("research", {}).get("source_credibility_threshold", 0.7)
         self.recency_preference_days = config.get("research", {}).get("recency_preference_days", 730)
+        self.search_workers = max(1, config.get("research", {}).get("search_workers", 3))
+        
+        # Insights prioritized below this get templated queries instead of an LLM call (0 disables).
+        # Only insights at or above the orchestrator's min_priority_score (0.6) reach research,
+        # so a threshold at or below that floor never takes effect
+        self.llm_query_gen_threshold = config.get("research", {}).get("llm_query_gen_threshold", 0.0)
+        
+        # Search results are cached on disk by normalized query; fallback queries are
+        # templated, so the same searches recur across insights and runs
+        cache_config = config.get("cache", {})
+        self.search_cache_enabled = cache_config.get("enable_search_cache", True)
+        self.search_cache_ttl_seconds = cache_config.get("search_cache_ttl_days", 7) * 86400
     
     def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Process research task and return structured findings"""
@@ -46,8 +81,7 @@ class ResearchAgent(BaseAgent):
     
     def validate_input(self, task: Dict[str, Any]) -> bool:
         """Validate research task input"""
-        required_fields = ["insight", "research_angle"]
-        return all(field in task for field in required_fields)
+        return _REQUIRED_TASK_FIELDS.issubset(task)
     
     def research_business_insight(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Research a business insight and find supporting evidence"""
@@ -63,41 +97,46 @@ class ResearchAgent(BaseAgent):
             # Generate targeted search queries
             search_queries = self.generate_search_queries(insight, research_angle)
             
-            # Execute searches and gather results
+            # Execute searches and gather results. Each search is an independent
+            # network round-trip, so they run concurrently; results keep query order
+            # (execute_web_search handles its own errors, so one failure can't abort the rest)
+            queries = [query_data["query"] for query_data in search_queries[:self.max_searches_per_insight]]
             all_search_results = []
-            for query_data in search_queries[:self.max_searches_per_insight]:
-                search_results = self.execute_web_search(query_data["query"])
-                all_search_results.extend(search_results)
+            if queries:
+                with ThreadPoolExecutor(max_workers=min(len(queries), self.search_workers)) as executor:
+                    for search_results in executor.map(self.execute_web_search, queries):
+                        all_search_results.extend(search_results)
             
             # Analyze and filter results
             research_analysis = self.analyze_search_results(insight, all_search_results)
             
-            # Package research findings
-            research_package = self.package_research_findings(insight, research_analysis, max_sources)
+            # Package research findings; other agents receive the plain dict form
+            package = self.package_research_findings(insight, research_analysis, max_sources)
+            research_package = package.to_dict()
             
-            # Save research data
-            research_file = self.file_manager.save_research_data(insight["id"], research_package)
+            # Save research data on the background writer; nothing downstream modifies the package
+            self._submit_io("research_data_save", self.file_manager.save_research_data,
+                            insight["id"], research_package)
             
             self.log_decision("research_completed", 
                             {"insight_id": insight["id"], 
-                             "findings_count": len(research_package.get("key_findings", [])),
-                             "case_studies_count": len(research_package.get("case_studies", []))}, 
+                             "findings_count": len(package.key_findings),
+                             "case_studies_count": len(package.case_studies)}, 
                             "research_package_created")
             
             # Update performance metrics
-            self.update_performance_metrics("insights_researched", 
-                                          self.memory.get("performance_metrics", {}).get("insights_researched", 0) + 1)
+            self.increment_performance_metric("insights_researched")
             
             # Learn from successful research patterns
-            if len(research_package.get("key_findings", [])) >= 2:
+            if len(package.key_findings) >= 2:
                 self.learn_from_success({
                     "research_angle": research_angle,
                     "insight_type": insight.get("type"),
                     "query_patterns": [q["query"] for q in search_queries],
-                    "findings_count": len(research_package.get("key_findings", []))
+                    "findings_count": len(package.key_findings)
                 })
             
-            self.save_memory()
+            self.save_memory_async()
             
             return research_package
             
@@ -126,8 +165,16 @@ class ResearchAgent(BaseAgent):
     
     def generate_search_queries(self, insight: Dict[str, Any], research_angle: str) -> List[Dict[str, Any]]:
         """Generate targeted search queries for the business insight"""
+        # Low-priority insights don't justify a query-generation round-trip
+        if insight.get("priority_score", 1.0) < self.llm_query_gen_threshold:
+            queries = self._generate_fallback_queries(insight, research_angle)
+            self.log_decision("queries_generated",
+                            {"insight_id": insight["id"], "query_count": len(queries), "llm_skipped": True},
+                            "fallback_queries_for_low_priority")
+            return queries
+        
         try:
-            prompt = SEARCH_QUERY_GENERATION_PROMPT.format(
+            prompt = SEARCH_QUERY_GENERATION_TEMPLATE.render(
                 insight_title=insight["title"],
                 business_context=insight.get("business_context", ""),
                 key_terms=", ".join(insight.get("key_terms", [])),
@@ -144,10 +191,10 @@ class ResearchAgent(BaseAgent):
             
             # Parse query generation response
             try:
-                queries = json.loads(response)
+                queries = json_utils.loads(response)
                 if not isinstance(queries, list):
                     raise ValueError("Response is not a list")
-            except json.JSONDecodeError:
+            except json_utils.JSONDecodeError:
                 # Fallback to manual query generation
                 queries = self._generate_fallback_queries(insight, research_angle)
             
@@ -161,14 +208,26 @@ class ResearchAgent(BaseAgent):
             self.logger.log_error("query_generation_error", str(e))
             return self._generate_fallback_queries(insight, research_angle)
     
-    def execute_web_search(self, query: str) -> List[Dict[str, Any]]:
+    def execute_web_search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """Execute web search and return results"""
         try:
-            # In Claude Code environment, this will use actual web search
-            search_results = self.web_search_client.search(query, max_results=5)
+            cache_key = self._search_cache_key(query, max_results)
+            cached = None
+            if self.search_cache_enabled:
+                cached = self.file_manager.load_cached_response("search", cache_key,
+                                                                max_age_seconds=self.search_cache_ttl_seconds)
+            
+            if cached is not None:
+                search_results = json_utils.loads(cached)
+            else:
+                # In Claude Code environment, this will use actual web search
+                search_results = self.web_search_client.search(query, max_results=max_results)
+                if self.search_cache_enabled:
+                    self.file_manager.save_cached_response("search", cache_key, json_utils.dumps(search_results))
             
             self.log_decision("web_search_executed", 
-                            {"query": query, "results_count": len(search_results)}, 
+                            {"query": query, "results_count": len(search_results),
+                             "cache_hit": cached is not None}, 
                             "search_completed")
             
             return search_results
@@ -177,8 +236,16 @@ class ResearchAgent(BaseAgent):
             self.logger.log_error("web_search_error", str(e), {"query": query})
             return []
     
+    def _search_cache_key(self, query: str, max_results: int) -> str:
+        """Cache key for a search: case and whitespace differences map to the same entry"""
+        normalized = " ".join(query.lower().split())
+        return hashlib.blake2b(f"{normalized}\x1f{max_results}".encode("utf-8"), digest_size=16).hexdigest()
+    
     def analyze_search_results(self, insight: Dict[str, Any], search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze search results for relevance and credibility"""
+        # Overlapping queries return the same pages; duplicates only cost prompt tokens
+        search_results = self._dedupe_search_results(search_results)
+        
         if not search_results:
             return {
                 "analysis_summary": "No search results found for analysis",
@@ -187,11 +254,25 @@ class ResearchAgent(BaseAgent):
                 "supporting_data": []
             }
         
+        # Findings below the threshold are dropped when packaging, so results that can't
+        # reach it aren't worth analysis tokens. Unscored results get the benefit of the doubt
+        min_credibility = self.credibility_threshold - _CREDIBILITY_PREFILTER_MARGIN
+        viable_results = [
+            result for result in search_results
+            if result.get("credibility_score", min_credibility) >= min_credibility
+        ]
+        if not viable_results:
+            self.log_decision("analysis_skipped",
+                            {"insight_id": insight["id"], "results_count": len(search_results)},
+                            "no_credible_results")
+            return self._generate_fallback_analysis(search_results)
+        
         try:
             # Use Claude to analyze search results
-            prompt = RESEARCH_ANALYSIS_PROMPT.format(
+            prompt = RESEARCH_ANALYSIS_TEMPLATE.render(
                 insight_title=insight["title"],
-                search_results=json.dumps(search_results[:10], indent=2)  # Limit to first 10 results
+                # Compact JSON: indentation only adds prompt tokens. Limit to first 10 results
+                search_results=json_utils.dumps(viable_results[:10])
             )
             
             response = self.model_router.generate_content(
@@ -204,8 +285,8 @@ class ResearchAgent(BaseAgent):
             
             # Parse analysis response
             try:
-                analysis = json.loads(response)
-            except json.JSONDecodeError:
+                analysis = json_utils.loads(response)
+            except json_utils.JSONDecodeError:
                 # Fallback analysis
                 analysis = self._generate_fallback_analysis(search_results)
             
@@ -221,58 +302,94 @@ class ResearchAgent(BaseAgent):
             self.logger.log_error("analysis_error", str(e))
             return self._generate_fallback_analysis(search_results)
     
-    def package_research_findings(self, insight: Dict[str, Any], analysis: Dict[str, Any], max_sources: int) -> Dict[str, Any]:
-        """Package research findings for content agent consumption"""
-        # Filter findings by credibility threshold
-        high_quality_findings = [
-            finding for finding in analysis.get("key_findings", [])
-            if finding.get("credibility_score", 0) >= self.credibility_threshold
-        ][:max_sources]
+    def _dedupe_search_results(self, search_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Drop results repeating an earlier URL or a near-identical snippet, keeping first occurrences"""
+        seen_urls = set()
+        kept_shingles: List[frozenset] = []
+        unique_results = []
         
-        high_quality_case_studies = [
-            case_study for case_study in analysis.get("case_studies", [])
-            if case_study.get("credibility_score", 0) >= self.credibility_threshold
-        ][:max_sources]
+        for result in search_results:
+            url = result.get("url", "").strip().lower().split("#", 1)[0].rstrip("/")
+            if url:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+            
+            words = _WORD_RE.findall(result.get("snippet", "").lower())
+            shingles = frozenset(
+                tuple(words[i:i + _SNIPPET_SHINGLE_SIZE])
+                for i in range(max(len(words) - _SNIPPET_SHINGLE_SIZE + 1, 1))
+            ) if words else frozenset()
+            if shingles and any(
+                len(shingles & other) / len(shingles | other) > _SNIPPET_DUPLICATE_JACCARD
+                for other in kept_shingles
+            ):
+                continue
+            
+            if shingles:
+                kept_shingles.append(shingles)
+            unique_results.append(result)
         
-        high_quality_data = [
-            data for data in analysis.get("supporting_data", [])
-            if data.get("credibility_score", 0) >= self.credibility_threshold
-        ][:max_sources]
+        removed = len(search_results) - len(unique_results)
+        if removed:
+            self.log_decision("search_results_deduplicated",
+                            {"input_count": len(search_results), "removed": removed},
+                            "duplicates_dropped")
         
-        research_package = {
-            "insight_id": insight["id"],
-            "research_summary": analysis.get("analysis_summary", ""),
-            "research_quality_score": self._calculate_research_quality_score(
-                high_quality_findings, high_quality_case_studies, high_quality_data
-            ),
-            "key_findings": high_quality_findings,
-            "case_studies": high_quality_case_studies,
-            "supporting_data": high_quality_data,
-            "research_metadata": {
-                "sources_found": len(analysis.get("key_findings", [])),
-                "sources_filtered": len(high_quality_findings),
-                "credibility_threshold": self.credibility_threshold,
-                "research_completed_at": self.file_manager.load_memory("research_agent").get("last_updated")
-            }
-        }
+        return unique_results
+    
+    def package_research_findings(self, insight: Dict[str, Any], analysis: Dict[str, Any], max_sources: int) -> ResearchPackage:
+        """Package research findings for content agent consumption"""
+        # Filter findings by credibility threshold
+        high_quality_findings, finding_scores = self._credible_items(analysis.get("key_findings", []), max_sources)
+        high_quality_case_studies, case_study_scores = self._credible_items(analysis.get("case_studies", []), max_sources)
+        high_quality_data, data_scores = self._credible_items(analysis.get("supporting_data", []), max_sources)
         
-        return research_package
+        return ResearchPackage(
+            insight_id=insight["id"],
+            research_summary=analysis.get("analysis_summary", ""),
+            research_quality_score=self._calculate_research_quality_score(
+                finding_scores, case_study_scores, data_scores
+            ),
+            key_findings=high_quality_findings,
+            case_studies=high_quality_case_studies,
+            supporting_data=high_quality_data,
+            research_metadata=ResearchMetadata(
+                sources_found=len(analysis.get("key_findings", [])),
+                sources_filtered=len(high_quality_findings),
+                credibility_threshold=self.credibility_threshold,
+                research_completed_at=datetime.now().isoformat()
+            )
+        )
+    
+    def _credible_items(self, items: List[Dict[str, Any]],
+                        max_sources: int) -> Tuple[List[Dict[str, Any]], List[float]]:
+        """The max_sources most credible items meeting the threshold, highest first (ties keep
+        input order), along with their scores so callers don't look them up again"""
+        threshold = self.credibility_threshold
+        scored = (
+            (score, item) for score, item in
+            ((item.get("credibility_score", 0), item) for item in items)
+            if score >= threshold
+        )
+        top = heapq.nlargest(max_sources, scored, key=itemgetter(0))
+        return [item for _, item in top], [score for score, _ in top]
     
     def _generate_fallback_queries(self, insight: Dict[str, Any], research_angle: str) -> List[Dict[str, Any]]:
         """Generate fallback queries when Claude query generation fails"""
-        framework_terms = insight.get("key_terms", [insight["title"]])
+        # Extracted insights may carry an empty key_terms list
+        term = (insight.get("key_terms") or [insight["title"]])[0]
         
         base_queries = [
-            f"SME {framework_terms[0]} case study success",
-            f"small business {framework_terms[0]} examples Australia",
-            f"{framework_terms[0]} implementation results data"
+            f"SME {term} case study success",
+            f"small business {term} examples Australia",
+            f"{term} implementation results data"
         ]
         
         # Add research angle specific queries
-        if research_angle == "supporting_evidence":
-            base_queries.append(f"{framework_terms[0]} benefits statistics SME")
-        elif research_angle == "contrarian_examples":
-            base_queries.append(f"{framework_terms[0]} failure risks small business")
+        angle_query = _FALLBACK_QUERY_BY_ANGLE.get(research_angle)
+        if angle_query:
+            base_queries.append(angle_query.format(term=term))
         
         return [
             {
@@ -303,15 +420,16 @@ class ResearchAgent(BaseAgent):
             "supporting_data": []
         }
     
-    def _calculate_research_quality_score(self, findings: List, case_studies: List, data: List) -> float:
-        """Calculate overall research quality score"""
-        total_items = len(findings) + len(case_studies) + len(data)
+    def _calculate_research_quality_score(self, finding_scores: List[float], case_study_scores: List[float],
+                                          data_scores: List[float]) -> float:
+        """Calculate overall research quality score from the items' credibility scores"""
+        total_items = len(finding_scores) + len(case_study_scores) + len(data_scores)
         if total_items == 0:
             return 0.0
         
         # Weight different types of research
-        findings_score = sum(f.get("credibility_score", 0) for f in findings) * 0.4
-        case_studies_score = sum(c.get("credibility_score", 0) for c in case_studies) * 0.4
-        data_score = sum(d.get("credibility_score", 0) for d in data) * 0.2
+        findings_score = sum(finding_scores) * 0.4
+        case_studies_score = sum(case_study_scores) * 0.4
+        data_score = sum(data_scores) * 0.2
         
         return min((findings_score + case_studies_score + data_score) / max(total_items, 1), 1.0)
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Typed structures for research results.
+The research agent builds these internally and converts them to plain dicts at the agent boundary.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass(slots=True)
+class ResearchMetadata:
+    """Bookkeeping about how a research package was assembled"""
+    sources_found: int
+    sources_filtered: int
+    credibility_threshold: float
+    research_completed_at: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for task results and saved files"""
+        return {
+            "sources_found": self.sources_found,
+            "sources_filtered": self.sources_filtered,
+            "credibility_threshold": self.credibility_threshold,
+            "research_completed_at": self.research_completed_at
+        }
+
+
+@dataclass(slots=True)
+class ResearchPackage:
+    """Credibility-filtered research findings for one insight"""
+    insight_id: str
+    research_summary: str
+    research_quality_score: float
+    key_findings: List[Dict[str, Any]]
+    case_studies: List[Dict[str, Any]]
+    supporting_data: List[Dict[str, Any]]
+    research_metadata: ResearchMetadata
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form for task results and saved files; the item lists are shared, not copied"""
+        return {
+            "insight_id": self.insight_id,
+            "research_summary": self.research_summary,
+            "research_quality_score": self.research_quality_score,
+            "key_findings": self.key_findings,
+            "case_studies": self.case_studies,
+            "supporting_data": self.supporting_data,
+            "research_metadata": self.research_metadata.to_dict()
+        }
@@ -1,3 +1,5 @@
+from config.prompts.template import PromptTemplate
+
 CMO_SYSTEM_PROMPT = """You are the CMO Orchestrator for "The Good Stuff" podcast, an autonomous agent that extracts business insights from podcast transcripts and coordinates content creation.
 
 Your role is to:
@@ -60,4 +62,51 @@ Brand Voice Alignment:
 - Data-backed challenges to conventional business wisdom
 - SME-focused rather than enterprise-focused
 
-Return the insights array reordered by priority (highest first) with updated priority_scores."""
\ No newline at end of file
+Return the insights array reordered by priority (highest first) with updated priority_scores."""
+
+EXTRACT_AND_PRIORITIZE_PROMPT = """Analyze this podcast transcript, extract key business insights that would make compelling social media content, and rank them by priority for content creation.
+
+Transcript:
+{transcript}
+
+Extract insights that meet these criteria:
+1. Contains a clear business framework or actionable process
+2. Challenges conventional wisdom or provides contrarian perspective
+3. Specific to small-medium enterprise needs
+4. Can generate multiple content pieces (threads, tweets, case studies)
+
+Score each insight's priority_score using these ranking criteria:
+1. Framework Clarity (30%): How clear and actionable is the business framework?
+2. Contrarian Potential (25%): Does it challenge conventional wisdom with compelling data?
+3. SME Relevance (25%): How relevant is it for small-medium enterprises?
+4. Content Variety (20%): Can it generate multiple types of content (threads, quotes, tips)?
+
+Brand Voice Alignment:
+- Pete & Andy's contrarian, framework-driven style
+- Practical advice over theoretical concepts
+- Data-backed challenges to conventional business wisdom
+- SME-focused rather than enterprise-focused
+
+Return a JSON array of insights ordered by priority (highest first) with this structure:
+[
+  {{
+    "id": "unique_insight_id",
+    "title": "Brief framework title",
+    "type": "framework|contrarian_take|case_study|tactical_tip",
+    "content": "Full insight explanation",
+    "key_terms": ["term1", "term2", "term3"],
+    "business_context": "SME context where this applies",
+    "steps": ["step1", "step2", "step3"] (if framework),
+    "contrarian_angle": "What conventional wisdom this challenges",
+    "content_potential_score": 0.0-1.0,
+    "sme_relevance_score": 0.0-1.0,
+    "priority_score": 0.0-1.0
+  }}
+]
+
+Focus on extracting 3-8 high-quality insights rather than many low-quality ones."""
+
+# Pre-parsed forms of the templates above
+INSIGHT_EXTRACTION_TEMPLATE = PromptTemplate(INSIGHT_EXTRACTION_PROMPT)
+INSIGHT_PRIORITIZATION_TEMPLATE = PromptTemplate(INSIGHT_PRIORITIZATION_PROMPT)
+EXTRACT_AND_PRIORITIZE_TEMPLATE = PromptTemplate(EXTRACT_AND_PRIORITIZE_PROMPT)
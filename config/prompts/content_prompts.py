@@ -1,3 +1,5 @@
+from config.prompts.template import PromptTemplate
+
 CONTENT_SYSTEM_PROMPT = """You are the Content Agent for "The Good Stuff" podcast CMO system. Your role is to generate engaging social media content that matches Pete & Andy's contrarian, framework-driven style.
 
 Brand Voice Guidelines:
@@ -211,4 +213,51 @@ Return JSON structure:
   "strengths": ["What works well in this content"],
   "improvements": ["Specific suggestions for better brand alignment"],
   "approval_recommendation": "approved|needs_revision|rejected"
-}}"""
\ No newline at end of file
+}}"""
+
+BRAND_VOICE_VALIDATION_BATCH_PROMPT = """Evaluate each of these social media content pieces for brand voice consistency with Pete & Andy's style.
+
+Content Pieces to Evaluate (each has an "index"): {content_pieces}
+
+Brand Voice Criteria:
+1. Contrarian Perspective: Challenges conventional business wisdom
+2. Framework-Driven: Provides structured, step-by-step approaches  
+3. Data-Backed: Uses specific statistics and real examples
+4. SME-Focused: Relevant for small-medium enterprises, not enterprise
+5. Practical: Actionable advice rather than theoretical concepts
+6. Direct Tone: Clear, no-nonsense communication style
+
+Evaluate every piece independently on a scale of 0.0-1.0 for:
+- Brand voice alignment
+- Content quality and engagement potential
+- SME relevance and actionability
+- Originality and contrarian perspective
+
+Return one result per piece, using the piece's index, in this JSON structure:
+{{
+  "results": [
+    {{
+      "index": 0,
+      "brand_voice_score": 0.85,
+      "evaluation_breakdown": {{
+        "contrarian_perspective": 0.9,
+        "framework_driven": 0.8,
+        "data_backed": 0.7,
+        "sme_focused": 0.9,
+        "practical_actionable": 0.8,
+        "direct_tone": 0.9
+      }},
+      "strengths": ["What works well in this content"],
+      "improvements": ["Specific suggestions for better brand alignment"],
+      "approval_recommendation": "approved|needs_revision|rejected"
+    }}
+  ]
+}}"""
+
+# Pre-parsed forms of the templates above
+FRAMEWORK_THREAD_TEMPLATE = PromptTemplate(FRAMEWORK_THREAD_PROMPT)
+CONTRARIAN_TWEET_TEMPLATE = PromptTemplate(CONTRARIAN_TWEET_PROMPT)
+CASE_STUDY_CONTENT_TEMPLATE = PromptTemplate(CASE_STUDY_CONTENT_PROMPT)
+TACTICAL_TIP_TEMPLATE = PromptTemplate(TACTICAL_TIP_PROMPT)
+BRAND_VOICE_VALIDATION_TEMPLATE = PromptTemplate(BRAND_VOICE_VALIDATION_PROMPT)
+BRAND_VOICE_VALIDATION_BATCH_TEMPLATE = PromptTemplate(BRAND_VOICE_VALIDATION_BATCH_PROMPT)
@@ -1,3 +1,5 @@
+from config.prompts.template import PromptTemplate
+
 RESEARCH_SYSTEM_PROMPT = """You are the Research Agent for "The Good Stuff" podcast CMO system. Your role is to find supporting evidence, case studies, and data that strengthen business insights for social media content.
 
 Research Focus:
@@ -91,4 +93,8 @@ Return JSON structure:
       "credibility_score": 0.0-1.0
     }}
   ]
-}}"""
\ No newline at end of file
+}}"""
+
+# Pre-parsed forms of the templates above
+SEARCH_QUERY_GENERATION_TEMPLATE = PromptTemplate(SEARCH_QUERY_GENERATION_PROMPT)
+RESEARCH_ANALYSIS_TEMPLATE = PromptTemplate(RESEARCH_ANALYSIS_PROMPT)
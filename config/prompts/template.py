@@ -0,0 +1,43 @@
+"""
+Pre-parsed prompt templates.
+Templates use str.format syntax but are parsed once at import, so rendering is plain concatenation.
+"""
+
+from string import Formatter
+from typing import Any, List, Optional, Tuple
+
+
+class PromptTemplate:
+    """A str.format-style prompt template parsed once and rendered by concatenation"""
+
+    def __init__(self, template: str):
+        self.template = template
+
+        # (literal_text, field_name, format_spec, conversion) with {{ }} already unescaped
+        self._segments: List[Tuple[str, Optional[str], str, Optional[str]]] = [
+            (literal, field, spec or "", conversion)
+            for literal, field, spec, conversion in Formatter().parse(template)
+        ]
+        self.fields = frozenset(field for _, field, _, _ in self._segments if field)
+
+    def render(self, **fields: Any) -> str:
+        """Fill in the template fields; raises KeyError for a missing field like str.format"""
+        parts = []
+        for literal, field, spec, conversion in self._segments:
+            parts.append(literal)
+            if field is None:
+                continue
+
+            value = fields[field]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            elif conversion == "a":
+                value = ascii(value)
+            parts.append(value if type(value) is str and not spec else format(value, spec))
+
+        return "".join(parts)
+
+    def __str__(self) -> str:
+        return self.template
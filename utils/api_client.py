@@ -1,6 +1,10 @@
 import openai
+import random
 import requests
+import threading
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from utils.logger import AgentLogger
@@ -14,9 +18,27 @@ class ContentGenerationError(Exception):
 
 class PublishingError(Exception):
     """Exception raised when publishing fails"""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retryable: bool = False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+class CircuitOpenError(PublishingError):
+    """Exception raised when a call is refused because the circuit breaker is open"""
     pass
 
 
+# Typefully responses that mean the request was not processed, so a POST can be resent safely
+TYPEFULLY_RETRYABLE_STATUS = frozenset((429, 503))
+
+# Attempts per Typefully write and the exponential backoff between them (seconds)
+TYPEFULLY_MAX_ATTEMPTS = 3
+TYPEFULLY_BACKOFF_INITIAL = 1.0
+TYPEFULLY_BACKOFF_MAX = 30.0
+
+
 class RateLimiter:
     """Simple rate limiter for API calls"""
     
@@ -24,26 +46,90 @@ class RateLimiter:
         self.calls = calls
         self.period = period
         self.call_times = []
+        self._lock = threading.Lock()
     
     def wait_if_needed(self):
         """Wait if rate limit would be exceeded"""
-        now = time.time()
-        
-        # Remove old calls outside the period
-        self.call_times = [t for t in self.call_times if now - t < self.period]
-        
-        # If we're at the limit, wait
-        if len(self.call_times) >= self.calls:
-            sleep_time = self.period - (now - self.call_times[0]) + 1
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-        
-        # Record this call
-        self.call_times.append(now)
+        while True:
+            with self._lock:
+                now = time.time()
+                
+                # Remove old calls outside the period
+                self.call_times = [t for t in self.call_times if now - t < self.period]
+                
+                # Under the limit: record this call and go
+                if len(self.call_times) < self.calls:
+                    self.call_times.append(now)
+                    return
+                
+                sleep_time = self.period - (now - self.call_times[0]) + 1
+            
+            # Sleep without the lock so other callers aren't held up, then re-check
+            # since another thread may have taken the freed slot in the meantime
+            time.sleep(sleep_time)
+
+
+class CircuitBreaker:
+    """Stops calling a failing service after repeated failures until a cool-down has passed"""
+    
+    def __init__(self, fail_max: int, reset_timeout: float, name: str = "circuit"):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.logger = AgentLogger(name)
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Whether a call may go through; after the cool-down one trial call is let through"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: re-arm the timer so only this caller probes the service
+                self._opened_at = time.monotonic()
+                return True
+            return False
+    
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        with self._lock:
+            if self._opened_at is not None:
+                self.logger.log_info("Circuit closed")
+            self._failures = 0
+            self._opened_at = None
+    
+    def record_failure(self):
+        """Count a failed call, opening the circuit once the threshold is reached"""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    self.logger.log_error("circuit_opened", f"{self._failures} consecutive failures",
+                                          {"reset_timeout": self.reset_timeout})
+                self._opened_at = time.monotonic()
 
 
 # Removed ClaudeClient - all calls now go through OpenRouter
 
+# One OpenAI SDK client per API key, shared by every agent so they draw on a
+# single keep-alive connection pool instead of each handshaking separately
+_openrouter_sdk_clients: Dict[str, "openai.OpenAI"] = {}
+_openrouter_sdk_lock = threading.Lock()
+
+
+def _get_openrouter_sdk_client(api_key: str) -> "openai.OpenAI":
+    """Return the shared OpenRouter SDK client for an API key, creating it on first use"""
+    with _openrouter_sdk_lock:
+        client = _openrouter_sdk_clients.get(api_key)
+        if client is None:
+            client = openai.OpenAI(
+                base_url="https://openrouter.ai/api/v1",
+                api_key=api_key
+            )
+            _openrouter_sdk_clients[api_key] = client
+        return client
+
 
 class TypefullyClient:
     """Client for Typefully API with error handling and rate limiting"""
@@ -57,11 +143,20 @@ class TypefullyClient:
         }
         self.logger = AgentLogger("typefully_client")
         self.rate_limiter = RateLimiter(calls=30, period=3600)  # Free tier limits
+        
+        # Keep-alive session so repeated calls reuse the TLS connection. Only GETs are
+        # retried at this level; retrying a POST could schedule the same post twice
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                      allowed_methods=frozenset(["GET"]))
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+        
+        # Shared across scheduling threads so an outage stops all of them at once
+        self.circuit_breaker = CircuitBreaker(fail_max=5, reset_timeout=60, name="typefully_circuit")
     
     def create_draft(self, content: str, thread_tweets: Optional[List[str]] = None) -> Dict[str, Any]:
         """Create a draft post in Typefully"""
-        self.rate_limiter.wait_if_needed()
-        
         if thread_tweets:
             # For threads, join all tweets with newlines - Typefully will auto-split
             full_content = "\n\n".join([content] + thread_tweets)
@@ -72,13 +167,11 @@ class TypefullyClient:
             "content": full_content
         }
         
-        return self._make_request("POST", "/v1/drafts/", payload)
+        return self._post_with_backoff("/v1/drafts/", payload)
     
     def schedule_post(self, content: str, publish_time: datetime, 
                      thread_tweets: Optional[List[str]] = None) -> Dict[str, Any]:
         """Schedule content for publication via Typefully"""
-        self.rate_limiter.wait_if_needed()
-        
         if thread_tweets:
             # For threads, join all tweets with newlines - Typefully will auto-split
             full_content = "\n\n".join([content] + thread_tweets)
@@ -90,7 +183,34 @@ class TypefullyClient:
             "schedule-date": publish_time.isoformat()
         }
         
-        return self._make_request("POST", "/v1/drafts/", payload)
+        return self._post_with_backoff("/v1/drafts/", payload)
+    
+    def _post_with_backoff(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST through the circuit breaker, backing off with jitter on retryable failures"""
+        if not self.circuit_breaker.allow():
+            raise CircuitOpenError("Typefully circuit open; skipping call", retryable=True)
+        
+        delay = TYPEFULLY_BACKOFF_INITIAL
+        for attempt in range(1, TYPEFULLY_MAX_ATTEMPTS + 1):
+            self.rate_limiter.wait_if_needed()
+            try:
+                result = self._make_request("POST", endpoint, payload)
+            except PublishingError as e:
+                # Client errors (bad payload, auth) still show the service is answering,
+                # which also closes the circuit after a half-open probe
+                if e.retryable or e.status_code is None or e.status_code >= 500:
+                    self.circuit_breaker.record_failure()
+                else:
+                    self.circuit_breaker.record_success()
+                if not e.retryable or attempt == TYPEFULLY_MAX_ATTEMPTS or not self.circuit_breaker.allow():
+                    raise
+                
+                # Full jitter keeps concurrent scheduling threads from retrying in lockstep
+                time.sleep(random.uniform(0, delay))
+                delay = min(delay * 2, TYPEFULLY_BACKOFF_MAX)
+            else:
+                self.circuit_breaker.record_success()
+                return result
     
     def get_drafts(self) -> List[Dict[str, Any]]:
         """Get all draft posts"""
@@ -108,9 +228,9 @@ class TypefullyClient:
         
         try:
             if method == "GET":
-                response = requests.get(url, headers=self.headers, params=params)
+                response = self.session.get(url, params=params)
             elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data)
+                response = self.session.post(url, json=data)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -124,8 +244,16 @@ class TypefullyClient:
                 self.logger.log_error("api_error", 
                                     f"HTTP {response.status_code}: {response.text}",
                                     {"endpoint": endpoint, "method": method})
-                raise PublishingError(f"Typefully API error: {response.status_code} - {response.text}")
-                
+                raise PublishingError(f"Typefully API error: {response.status_code} - {response.text}",
+                                      status_code=response.status_code,
+                                      retryable=response.status_code in TYPEFULLY_RETRYABLE_STATUS)
+        
+        except requests.exceptions.ConnectTimeout as e:
+            # The connection was never made, so nothing reached Typefully
+            self.logger.log_api_call("typefully", endpoint, False, time.time() - start_time)
+            self.logger.log_error("network_error", str(e), {"endpoint": endpoint, "method": method})
+            raise PublishingError(f"Network error: {e}", retryable=True)
+        
         except requests.exceptions.RequestException as e:
             self.logger.log_api_call("typefully", endpoint, False, time.time() - start_time)
             self.logger.log_error("network_error", str(e), {"endpoint": endpoint, "method": method})
@@ -140,10 +268,7 @@ class OpenRouterClient:
     """Unified client for all models via OpenRouter API"""
     
     def __init__(self, api_key: str, config: Optional[Dict[str, Any]] = None):
-        self.client = openai.OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key
-        )
+        self.client = _get_openrouter_sdk_client(api_key)
         self.logger = AgentLogger("openrouter_client")
         self.rate_limiter = RateLimiter(calls=30, period=60)
         self.cost_monitor = CostMonitor(config or {})
@@ -166,6 +291,9 @@ class OpenRouterClient:
         
         # Token estimation
         self.chars_per_token = 4
+        
+        # Mark the system prompt as a cacheable prefix for providers that support it
+        self.enable_prompt_cache = (config or {}).get("model_routing", {}).get("enable_prompt_cache", False)
     
     def generate_content(self, system_prompt: str, user_prompt: str,
                         model: str = "deepseek/deepseek-chat",
@@ -210,7 +338,7 @@ class OpenRouterClient:
                 model=model,
                 max_tokens=max_tokens,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    self._build_system_message(system_prompt, model),
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.7
@@ -259,6 +387,17 @@ class OpenRouterClient:
             self.logger.log_api_call("openrouter", model, False, time.time() - start_time)
             self.logger.log_error("openrouter_unexpected_error", str(e))
             raise ContentGenerationError(f"OpenRouter unexpected error: {e}")
+    
+    def _build_system_message(self, system_prompt: str, model: str) -> Dict[str, Any]:
+        """Build the system message, adding a cache breakpoint for Anthropic models when enabled"""
+        # The agents' system prompts are module constants, so the prefix is byte-identical
+        # across calls and the provider can reuse it; other providers cache automatically
+        if self.enable_prompt_cache and model.startswith("anthropic/"):
+            return {
+                "role": "system",
+                "content": [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+            }
+        return {"role": "system", "content": system_prompt}
 
 
 class ModelRouter:
@@ -273,6 +412,7 @@ class ModelRouter:
             # High complexity - requires Claude's reasoning via OpenRouter
             "insight_extraction": "anthropic/claude-3-5-sonnet",
             "insight_prioritization": "anthropic/claude-3-5-sonnet", 
+            "extract_prioritize": "anthropic/claude-3-5-sonnet",
             "research_analysis": "anthropic/claude-3-5-sonnet",
             "brand_voice_validation": "anthropic/claude-3-5-sonnet",
             
@@ -294,7 +434,7 @@ class ModelRouter:
         """Route request to optimal model based on task complexity via OpenRouter"""
         
         # Determine which model to use
-        selected_model = self.task_models.get(task_type, self.default_model)
+        selected_model = self.model_for(task_type)
         
         self.logger.log_info("routing_request", {
             "task_type": task_type,
@@ -308,6 +448,10 @@ class ModelRouter:
             system_prompt, user_prompt, selected_model, max_tokens, agent_name, episode_id
         )
     
+    def model_for(self, task_type: str) -> str:
+        """Model a task type is routed to"""
+        return self.task_models.get(task_type, self.default_model)
+    
     def get_cost_summary(self) -> Dict[str, Any]:
         """Get cost breakdown by model type"""
         return {
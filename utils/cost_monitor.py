@@ -4,13 +4,20 @@ Prevents bill shock by tracking usage and enforcing limits.
 """
 
 import json
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from utils.logger import AgentLogger
 
 
+# One lock and in-memory usage record per usage file, shared by every monitor
+# that tracks it so concurrent read-modify-write cycles don't lose updates
+_shared_usage: Dict[Path, Tuple[threading.RLock, Dict[str, Any]]] = {}
+_shared_usage_lock = threading.Lock()
+
+
 class CostMonitor:
     """Monitor and limit API usage costs to prevent bill shock"""
     
@@ -31,7 +38,18 @@ class CostMonitor:
         self.input_token_cost = 0.000003  # $3 per 1M input tokens
         self.output_token_cost = 0.000015  # $15 per 1M output tokens
         
-        self.usage_data = self.load_usage_data()
+        # Each agent's client builds its own monitor; monitors on the same usage
+        # file share its lock and data, so pipeline threads see each other's usage
+        self._lock, self.usage_data = self._get_shared_usage()
+    
+    def _get_shared_usage(self) -> Tuple[threading.RLock, Dict[str, Any]]:
+        """Return the lock and usage data shared for this usage file, loading them on first use"""
+        key = self.usage_file.resolve()
+        with _shared_usage_lock:
+            shared = _shared_usage.get(key)
+            if shared is None:
+                shared = _shared_usage[key] = (threading.RLock(), self.load_usage_data())
+            return shared
     
     def load_usage_data(self) -> Dict[str, Any]:
         """Load existing usage data"""
@@ -75,145 +93,147 @@ class CostMonitor:
     def check_pre_request_limits(self, agent_name: str, estimated_tokens: int, 
                                 episode_id: Optional[str] = None) -> Dict[str, Any]:
         """Check if request would exceed limits BEFORE making API call"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        current_month = datetime.now().strftime("%Y-%m")
-        
-        # Get current usage
-        daily_tokens = self.usage_data["daily_usage"].get(today, {}).get("total_tokens", 0)
-        episode_tokens = 0
-        if episode_id:
-            episode_tokens = self.usage_data["episode_usage"].get(episode_id, {}).get("total_tokens", 0)
-        
-        monthly_cost = self.usage_data["monthly_totals"].get(current_month, {}).get("total_cost_usd", 0)
-        
-        # Check limits
-        daily_would_exceed = (daily_tokens + estimated_tokens) > self.daily_token_limit
-        episode_would_exceed = episode_id and (episode_tokens + estimated_tokens) > self.episode_token_limit
-        
-        # Estimate cost
-        estimated_cost = estimated_tokens * self.input_token_cost
-        monthly_would_exceed = (monthly_cost + estimated_cost) > self.monthly_budget_usd
-        
-        result = {
-            "allowed": True,
-            "reasons": [],
-            "current_usage": {
-                "daily_tokens": daily_tokens,
-                "episode_tokens": episode_tokens,
-                "monthly_cost_usd": round(monthly_cost, 2)
-            },
-            "limits": {
-                "daily_token_limit": self.daily_token_limit,
-                "episode_token_limit": self.episode_token_limit,
-                "monthly_budget_usd": self.monthly_budget_usd
-            },
-            "estimated_cost_usd": round(estimated_cost, 4)
-        }
+        with self._lock:
+            today = datetime.now().strftime("%Y-%m-%d")
+            current_month = datetime.now().strftime("%Y-%m")
+        
+            # Get current usage
+            daily_tokens = self.usage_data["daily_usage"].get(today, {}).get("total_tokens", 0)
+            episode_tokens = 0
+            if episode_id:
+                episode_tokens = self.usage_data["episode_usage"].get(episode_id, {}).get("total_tokens", 0)
+        
+            monthly_cost = self.usage_data["monthly_totals"].get(current_month, {}).get("total_cost_usd", 0)
+        
+            # Check limits
+            daily_would_exceed = (daily_tokens + estimated_tokens) > self.daily_token_limit
+            episode_would_exceed = episode_id and (episode_tokens + estimated_tokens) > self.episode_token_limit
+        
+            # Estimate cost
+            estimated_cost = estimated_tokens * self.input_token_cost
+            monthly_would_exceed = (monthly_cost + estimated_cost) > self.monthly_budget_usd
+        
+            result = {
+                "allowed": True,
+                "reasons": [],
+                "current_usage": {
+                    "daily_tokens": daily_tokens,
+                    "episode_tokens": episode_tokens,
+                    "monthly_cost_usd": round(monthly_cost, 2)
+                },
+                "limits": {
+                    "daily_token_limit": self.daily_token_limit,
+                    "episode_token_limit": self.episode_token_limit,
+                    "monthly_budget_usd": self.monthly_budget_usd
+                },
+                "estimated_cost_usd": round(estimated_cost, 4)
+            }
         
-        # Check each limit
-        if daily_would_exceed:
-            result["allowed"] = False
-            result["reasons"].append(f"Daily token limit would be exceeded: {daily_tokens + estimated_tokens} > {self.daily_token_limit}")
+            # Check each limit
+            if daily_would_exceed:
+                result["allowed"] = False
+                result["reasons"].append(f"Daily token limit would be exceeded: {daily_tokens + estimated_tokens} > {self.daily_token_limit}")
         
-        if episode_would_exceed:
-            result["allowed"] = False
-            result["reasons"].append(f"Episode token limit would be exceeded: {episode_tokens + estimated_tokens} > {self.episode_token_limit}")
+            if episode_would_exceed:
+                result["allowed"] = False
+                result["reasons"].append(f"Episode token limit would be exceeded: {episode_tokens + estimated_tokens} > {self.episode_token_limit}")
         
-        if monthly_would_exceed:
-            result["allowed"] = False
-            result["reasons"].append(f"Monthly budget would be exceeded: ${monthly_cost + estimated_cost:.2f} > ${self.monthly_budget_usd}")
+            if monthly_would_exceed:
+                result["allowed"] = False
+                result["reasons"].append(f"Monthly budget would be exceeded: ${monthly_cost + estimated_cost:.2f} > ${self.monthly_budget_usd}")
         
-        if not result["allowed"]:
-            self.logger.log_error("cost_limit_exceeded", 
-                                f"Request blocked - would exceed limits", 
-                                {"agent": agent_name, "reasons": result["reasons"]})
+            if not result["allowed"]:
+                self.logger.log_error("cost_limit_exceeded", 
+                                    f"Request blocked - would exceed limits", 
+                                    {"agent": agent_name, "reasons": result["reasons"]})
         
-        return result
+            return result
     
     def record_api_usage(self, agent_name: str, input_tokens: int, output_tokens: int, 
                         episode_id: Optional[str] = None, success: bool = True):
         """Record actual API usage after request completes"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        current_month = datetime.now().strftime("%Y-%m")
-        timestamp = datetime.now().isoformat()
-        
-        # Calculate costs
-        input_cost = input_tokens * self.input_token_cost
-        output_cost = output_tokens * self.output_token_cost
-        total_cost = input_cost + output_cost
-        total_tokens = input_tokens + output_tokens
-        
-        # Update daily usage
-        if today not in self.usage_data["daily_usage"]:
-            self.usage_data["daily_usage"][today] = {
-                "total_tokens": 0,
-                "total_cost_usd": 0,
-                "requests": 0,
-                "agents": {}
-            }
-        
-        daily = self.usage_data["daily_usage"][today]
-        daily["total_tokens"] += total_tokens
-        daily["total_cost_usd"] += total_cost
-        daily["requests"] += 1
-        
-        if agent_name not in daily["agents"]:
-            daily["agents"][agent_name] = {"tokens": 0, "cost_usd": 0, "requests": 0}
-        
-        daily["agents"][agent_name]["tokens"] += total_tokens
-        daily["agents"][agent_name]["cost_usd"] += total_cost
-        daily["agents"][agent_name]["requests"] += 1
-        
-        # Update episode usage
-        if episode_id:
-            if episode_id not in self.usage_data["episode_usage"]:
-                self.usage_data["episode_usage"][episode_id] = {
+        with self._lock:
+            today = datetime.now().strftime("%Y-%m-%d")
+            current_month = datetime.now().strftime("%Y-%m")
+            timestamp = datetime.now().isoformat()
+        
+            # Calculate costs
+            input_cost = input_tokens * self.input_token_cost
+            output_cost = output_tokens * self.output_token_cost
+            total_cost = input_cost + output_cost
+            total_tokens = input_tokens + output_tokens
+        
+            # Update daily usage
+            if today not in self.usage_data["daily_usage"]:
+                self.usage_data["daily_usage"][today] = {
                     "total_tokens": 0,
                     "total_cost_usd": 0,
-                    "agents": {},
-                    "timestamp": timestamp
+                    "requests": 0,
+                    "agents": {}
                 }
+        
+            daily = self.usage_data["daily_usage"][today]
+            daily["total_tokens"] += total_tokens
+            daily["total_cost_usd"] += total_cost
+            daily["requests"] += 1
+        
+            if agent_name not in daily["agents"]:
+                daily["agents"][agent_name] = {"tokens": 0, "cost_usd": 0, "requests": 0}
+        
+            daily["agents"][agent_name]["tokens"] += total_tokens
+            daily["agents"][agent_name]["cost_usd"] += total_cost
+            daily["agents"][agent_name]["requests"] += 1
+        
+            # Update episode usage
+            if episode_id:
+                if episode_id not in self.usage_data["episode_usage"]:
+                    self.usage_data["episode_usage"][episode_id] = {
+                        "total_tokens": 0,
+                        "total_cost_usd": 0,
+                        "agents": {},
+                        "timestamp": timestamp
+                    }
             
-            episode = self.usage_data["episode_usage"][episode_id]
-            episode["total_tokens"] += total_tokens
-            episode["total_cost_usd"] += total_cost
+                episode = self.usage_data["episode_usage"][episode_id]
+                episode["total_tokens"] += total_tokens
+                episode["total_cost_usd"] += total_cost
             
-            if agent_name not in episode["agents"]:
-                episode["agents"][agent_name] = {"tokens": 0, "cost_usd": 0}
+                if agent_name not in episode["agents"]:
+                    episode["agents"][agent_name] = {"tokens": 0, "cost_usd": 0}
             
-            episode["agents"][agent_name]["tokens"] += total_tokens
-            episode["agents"][agent_name]["cost_usd"] += total_cost
-        
-        # Update monthly totals
-        if current_month not in self.usage_data["monthly_totals"]:
-            self.usage_data["monthly_totals"][current_month] = {
-                "total_tokens": 0,
-                "total_cost_usd": 0,
-                "requests": 0
-            }
+                episode["agents"][agent_name]["tokens"] += total_tokens
+                episode["agents"][agent_name]["cost_usd"] += total_cost
         
-        monthly = self.usage_data["monthly_totals"][current_month]
-        monthly["total_tokens"] += total_tokens
-        monthly["total_cost_usd"] += total_cost
-        monthly["requests"] += 1
+            # Update monthly totals
+            if current_month not in self.usage_data["monthly_totals"]:
+                self.usage_data["monthly_totals"][current_month] = {
+                    "total_tokens": 0,
+                    "total_cost_usd": 0,
+                    "requests": 0
+                }
         
-        # Update timestamp
-        self.usage_data["last_updated"] = timestamp
+            monthly = self.usage_data["monthly_totals"][current_month]
+            monthly["total_tokens"] += total_tokens
+            monthly["total_cost_usd"] += total_cost
+            monthly["requests"] += 1
         
-        # Save usage data
-        self.save_usage_data()
+            # Update timestamp
+            self.usage_data["last_updated"] = timestamp
         
-        # Log usage
-        self.logger.log_info("api_usage_recorded", {
-            "agent": agent_name,
-            "episode_id": episode_id,
-            "tokens": total_tokens,
-            "cost_usd": round(total_cost, 4),
-            "success": success
-        })
+            # Save usage data
+            self.save_usage_data()
+        
+            # Log usage
+            self.logger.log_info("api_usage_recorded", {
+                "agent": agent_name,
+                "episode_id": episode_id,
+                "tokens": total_tokens,
+                "cost_usd": round(total_cost, 4),
+                "success": success
+            })
         
-        # Check if approaching limits
-        self.check_usage_warnings(agent_name)
+            # Check if approaching limits
+            self.check_usage_warnings(agent_name)
     
     def save_usage_data(self):
         """Save usage data to file"""
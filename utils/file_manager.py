@@ -1,8 +1,16 @@
+import gzip
 import json
 import os
+import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from utils import json_utils
+
+
+# Memory sections persisted as append-only JSONL instead of in the memory snapshot
+MEMORY_JOURNAL_SECTIONS = ("decisions", "successful_patterns", "failed_patterns")
 
 
 class FileManager:
@@ -12,11 +20,12 @@ class FileManager:
         self.research_dir = self.data_dir / "research"
         self.content_dir = self.data_dir / "content"
         self.memory_dir = self.data_dir / "memory"
+        self.cache_dir = self.data_dir / "cache"
         
         # Ensure directories exist
         for directory in [self.transcripts_dir, self.research_dir, 
                          self.content_dir / "generated", self.content_dir / "published",
-                         self.memory_dir]:
+                         self.memory_dir, self.cache_dir]:
             directory.mkdir(parents=True, exist_ok=True)
     
     def load_transcript(self, transcript_path: str) -> Dict[str, Any]:
@@ -44,21 +53,30 @@ class FileManager:
         filepath = self.research_dir / filename
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(research_data, f, indent=2, ensure_ascii=False)
+            f.write(json_utils.dumps(research_data, pretty=True))
         
         return str(filepath)
     
     def save_generated_content(self, episode_id: str, content_data: Dict[str, Any]) -> str:
         """Save generated content to file"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{timestamp}_{episode_id}_content.json"
+        filename = f"{timestamp}_{episode_id}_content.json.gz"
         filepath = self.content_dir / "generated" / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(content_data, f, indent=2, ensure_ascii=False)
+        # Summaries embed all generated text (the transcript is only referenced), which compresses well
+        with gzip.open(filepath, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(json_utils.dumps(content_data))
         
         return str(filepath)
     
+    def load_generated_content(self, filepath: str) -> Dict[str, Any]:
+        """Load a saved content summary, compressed or plain JSON"""
+        path = Path(filepath)
+        opener = gzip.open if path.suffix == ".gz" else open
+        
+        with opener(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    
     def save_published_content(self, episode_id: str, published_data: Dict[str, Any]) -> str:
         """Save published content tracking data"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -66,7 +84,7 @@ class FileManager:
         filepath = self.content_dir / "published" / filename
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(published_data, f, indent=2, ensure_ascii=False)
+            f.write(json_utils.dumps(published_data, pretty=True))
         
         return str(filepath)
     
@@ -75,8 +93,8 @@ class FileManager:
         memory_file = self.memory_dir / f"{agent_name}_memory.json"
         
         if memory_file.exists():
-            with open(memory_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(memory_file, 'rb') as f:
+                return json_utils.loads(f.read())
         
         # Return default memory structure if file doesn't exist
         return {
@@ -92,8 +110,81 @@ class FileManager:
         memory_file = self.memory_dir / f"{agent_name}_memory.json"
         memory_data["last_updated"] = datetime.now().isoformat()
         
-        with open(memory_file, 'w', encoding='utf-8') as f:
-            json.dump(memory_data, f, indent=2, ensure_ascii=False)
+        # Journal sections live in their own append-only JSONL files
+        snapshot = {
+            key: value for key, value in memory_data.items()
+            if key not in MEMORY_JOURNAL_SECTIONS
+        }
+        
+        # Write then rename so concurrent readers never see a truncated file
+        tmp_file = memory_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(json_utils.dumps(snapshot, pretty=True))
+        os.replace(tmp_file, memory_file)
+    
+    def append_jsonl(self, agent_name: str, section: str, records: List[str]):
+        """Append serialized records to an agent's JSONL journal in one write"""
+        journal_file = self.memory_dir / f"{agent_name}_{section}.jsonl"
+        
+        with open(journal_file, 'a', encoding='utf-8') as f:
+            f.write("\n".join(records) + "\n")
+    
+    def tail_jsonl(self, agent_name: str, section: str, limit: int) -> List[Dict[str, Any]]:
+        """Load the last `limit` records from an agent's JSONL journal"""
+        journal_file = self.memory_dir / f"{agent_name}_{section}.jsonl"
+        
+        if not journal_file.exists():
+            return []
+        
+        with open(journal_file, 'r', encoding='utf-8') as f:
+            lines = deque(f, maxlen=limit)
+        
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Skip a partially written trailing line
+                continue
+        return records
+    
+    def load_cached_response(self, namespace: str, key: str,
+                             max_age_seconds: Optional[float] = None) -> Optional[str]:
+        """Load a cached API response, or None if it isn't cached (or is older than max_age_seconds)"""
+        cache_file = self.cache_dir / namespace / f"{key}.json"
+        
+        if not cache_file.exists():
+            return None
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                entry = json_utils.loads(f.read())
+            if max_age_seconds is not None:
+                cached_at = datetime.fromisoformat(entry["cached_at"])
+                if (datetime.now() - cached_at).total_seconds() > max_age_seconds:
+                    return None
+            return entry.get("response")
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def delete_cached_response(self, namespace: str, key: str):
+        """Remove a cached API response if it exists"""
+        cache_file = self.cache_dir / namespace / f"{key}.json"
+        try:
+            cache_file.unlink()
+        except FileNotFoundError:
+            pass
+    
+    def save_cached_response(self, namespace: str, key: str, response: str):
+        """Persist an API response to the on-disk cache"""
+        cache_file = self.cache_dir / namespace / f"{key}.json"
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write then rename so concurrent readers never see a partial entry
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(json_utils.dumps({"response": response, "cached_at": datetime.now().isoformat()}))
+        os.replace(tmp_file, cache_file)
     
     def load_brand_voice(self) -> Dict[str, Any]:
         """Load brand voice configuration"""
@@ -0,0 +1,62 @@
+"""
+JSON encoding and decoding helpers.
+Uses orjson when it is installed and falls back to the standard library otherwise.
+"""
+
+import json
+import re
+from collections import deque
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one name covers both
+JSONDecodeError = json.JSONDecodeError
+
+# Opening fence with optional language tag, or closing fence, at the ends of a response
+_FENCE_RE = re.compile(r"\A```[A-Za-z]*[ \t]*\n?|\n?[ \t]*```\Z")
+
+
+def strip_code_fences(text: str) -> str:
+    """Remove a markdown code fence wrapped around a model response"""
+    return _FENCE_RE.sub("", text.strip()).strip()
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types the JSON encoders don't handle natively"""
+    if isinstance(obj, (deque, set, frozenset)):
+        return list(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def loads(data: Any) -> Any:
+        """Parse a JSON document from str or bytes"""
+        return orjson.loads(data)
+
+    def dumps(obj: Any, pretty: bool = False) -> str:
+        """Serialize to a JSON string, compact unless pretty is set"""
+        options = _OPTIONS | orjson.OPT_INDENT_2 if pretty else _OPTIONS
+        return orjson.dumps(obj, default=_default, option=options).decode("utf-8")
+else:
+    def loads(data: Any) -> Any:
+        """Parse a JSON document from str or bytes"""
+        return json.loads(data)
+
+    def dumps(obj: Any, pretty: bool = False) -> str:
+        """Serialize to a JSON string, compact unless pretty is set"""
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
@@ -2,7 +2,7 @@ import logging
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 
 class AgentLogger:
@@ -36,20 +36,19 @@ class AgentLogger:
             self.logger.addHandler(file_handler)
             self.logger.addHandler(console_handler)
     
-    def log_decision(self, decision_type: str, context: Dict[str, Any], outcome: str):
-        """Log agent decisions for audit and learning"""
-        decision_log = {
-            "timestamp": datetime.now().isoformat(),
-            "agent": self.agent_name,
-            "decision_type": decision_type,
-            "context": context,
-            "outcome": outcome
-        }
+    def log_decisions(self, records: List[str]):
+        """Log a batch of serialized decision records in a single call"""
+        if not records or not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        self.logger.info(f"DECISION: {json.dumps(decision_log)}")
+        self.logger.info("\n".join(f"DECISION: {record}" for record in records))
     
     def log_api_call(self, service: str, endpoint: str, success: bool, duration: float):
         """Log API calls for monitoring and debugging"""
+        level = logging.INFO if success else logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
+        
         api_log = {
             "timestamp": datetime.now().isoformat(),
             "agent": self.agent_name,
@@ -59,11 +58,13 @@ class AgentLogger:
             "duration_seconds": duration
         }
         
-        level = logging.INFO if success else logging.ERROR
         self.logger.log(level, f"API_CALL: {json.dumps(api_log)}")
     
     def log_error(self, error_type: str, error_message: str, context: Dict[str, Any] = None):
         """Log errors with context"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         error_log = {
             "timestamp": datetime.now().isoformat(),
             "agent": self.agent_name,
@@ -76,6 +77,10 @@ class AgentLogger:
     
     def log_info(self, message: str, context: Dict[str, Any] = None):
         """Log informational messages"""
+        # Skip building and serializing the payload when INFO is filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         info_log = {
             "timestamp": datetime.now().isoformat(),
             "agent": self.agent_name,